@@ -0,0 +1,199 @@
+"""
+Per-frame pixel kernels used by the MoviePy code paths.
+
+Kernels are compiled with Numba when it is installed (with cache=True, so the compiled
+code is reused across processes) and fall back to equivalent vectorized NumPy otherwise,
+so callers never need to check which one they got.
+"""
+import functools
+import itertools
+import logging
+import threading
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+
+# scale_frame multipliers are Q15 fixed point: SCALE_ONE leaves a pixel unchanged. 255 * SCALE_ONE
+# still fits in 32 bits and SCALE_ONE itself in a uint16, so the multiplier array stays 16-bit
+SCALE_SHIFT = 15
+SCALE_ONE = 1 << SCALE_SHIFT
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Per-thread uint32 work arrays for the NumPy scaling path, keyed by frame shape
+_scratch = threading.local()
+
+
+def _uint32_scratch(shape: Tuple[int, ...]) -> np.ndarray:
+    buffers = _scratch.__dict__.setdefault('buffers', {})
+    if shape not in buffers:
+        buffers[shape] = np.empty(shape, dtype=np.uint32)
+    return buffers[shape]
+
+
+def _scale_frame_numpy(frame, scale, out):
+    # In-place ufuncs on a reused work array: no temporaries are allocated per frame
+    product = _uint32_scratch(frame.shape)
+    np.multiply(frame, scale, out=product, dtype=np.uint32)
+    np.right_shift(product, SCALE_SHIFT, out=product)
+    np.copyto(out, product, casting='unsafe')
+
+
+# Which implementation the kernels below come from: 'numba' or 'numpy'
+if HAS_NUMBA:
+    KERNEL_BACKEND = 'numba'
+
+    # cache=True stores the compiled machine code next to this module, so only the
+    # very first run on a machine pays the compilation cost. nogil=True lets other Python
+    # threads (MoviePy's audio writer, concurrent jobs in the web app) run during a kernel
+    @njit(parallel=True, nogil=True, fastmath=True, cache=True)
+    def _blend_premultiplied_region(premultiplied, x, y, out):
+        height, width = premultiplied.shape[0], premultiplied.shape[1]
+        for i in prange(height):
+            for j in range(width):
+                inverse_alpha = np.int32(premultiplied[i, j, 3])
+                for c in range(3):
+                    blended = (np.int32(premultiplied[i, j, c])
+                               + np.int32(out[y + i, x + j, c]) * inverse_alpha) // 255
+                    out[y + i, x + j, c] = np.uint8(blended)
+
+    @njit(parallel=True, nogil=True, fastmath=True, cache=True)
+    def _scale_frame_array(frame, scale, out):
+        for i in prange(frame.shape[0]):
+            for j in range(frame.shape[1]):
+                pixel_scale = np.uint32(scale[i, j, 0])
+                for c in range(frame.shape[2]):
+                    out[i, j, c] = np.uint8((np.uint32(frame[i, j, c]) * pixel_scale) >> SCALE_SHIFT)
+else:
+    KERNEL_BACKEND = 'numpy'
+
+    def _blend_premultiplied_region(premultiplied, x, y, out):
+        height, width = premultiplied.shape[0], premultiplied.shape[1]
+        region = out[y:y + height, x:x + width]
+        out[y:y + height, x:x + width] = (premultiplied[:, :, :3] + region * premultiplied[:, :, 3:4]) // 255
+
+    _scale_frame_array = _scale_frame_numpy
+
+
+def premultiply_alpha(overlay: np.ndarray) -> np.ndarray:
+    """
+    Convert an RGBA overlay into the form alpha_composite blends from.
+
+    Do this once per overlay and pass the result to alpha_composite for every frame,
+    so the per-frame work is a single multiply-add over the covered region.
+
+    Args:
+        overlay: uint8 array of shape (h, w, 4)
+
+    Returns:
+        Read-only, C-contiguous uint16 array of shape (h, w, 4): RGB * alpha plus a
+        rounding term in the first three channels and 255 - alpha in the last
+    """
+    if overlay.dtype == np.uint16:
+        return overlay
+    premultiplied = np.empty(overlay.shape, dtype=np.uint16)
+    alpha = overlay[:, :, 3:4].astype(np.uint16)
+    np.multiply(overlay[:, :, :3], alpha, out=premultiplied[:, :, :3])
+    premultiplied[:, :, :3] += 127
+    premultiplied[:, :, 3:4] = 255 - alpha
+    premultiplied.flags.writeable = False
+    return premultiplied
+
+
+def buffer_ring(shape: Tuple[int, ...], count: int = 2) -> Iterator[np.ndarray]:
+    """
+    Preallocated uint8 output buffers handed out in turn (use next() for each frame).
+
+    Kernels can then write frames without allocating. A buffer is reused only after count - 1
+    newer frames, so the consumer must be done with a frame by then; MoviePy's writer and
+    composite copy or encode each frame before requesting the next.
+    """
+    return itertools.cycle([np.empty(shape, dtype=np.uint8) for _ in range(count)])
+
+
+def alpha_composite(frame: np.ndarray, overlay: np.ndarray, x: int, y: int,
+                    out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Blend an RGBA overlay onto an RGB frame with its top-left corner at (x, y).
+
+    Args:
+        frame: uint8 array of shape (H, W, 3)
+        overlay: uint8 array of shape (h, w, 4), or the output of premultiply_alpha
+                 (preferred when the same overlay is blended into many frames); parts
+                 outside the frame are ignored
+        x, y: Overlay position in frame pixels (may be negative)
+        out: Optional uint8 (H, W, 3) array to write into (may be frame itself); a new
+             array is allocated when omitted
+
+    Returns:
+        The composited frame (out, if given)
+    """
+    if out is None:
+        out = np.array(frame, dtype=np.uint8, order='C')
+    elif out is not frame:
+        out[...] = frame
+
+    # Clip the overlay to the frame bounds
+    frame_height, frame_width = frame.shape[:2]
+    left, top = max(x, 0), max(y, 0)
+    right = min(x + overlay.shape[1], frame_width)
+    bottom = min(y + overlay.shape[0], frame_height)
+    if right <= left or bottom <= top:
+        return out
+    visible = np.ascontiguousarray(premultiply_alpha(overlay[top - y:bottom - y, left - x:right - x]))
+
+    # out already holds the frame's pixels
+    _blend_premultiplied_region(visible, left, top, out)
+    return out
+
+
+def scale_frame(frame: np.ndarray, scale: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Scale the brightness of an RGB frame by a Q15 fixed-point multiplier: (frame * scale) >> 15.
+
+    Args:
+        frame: uint8 array of shape (H, W, 3), contiguous or not
+        scale: uint16 multiplier in [0, SCALE_ONE] (SCALE_ONE = unchanged), either a scalar or
+               an (H, W, 1) array
+               shared by the three channels
+        out: Optional uint8 (H, W, 3) array to write into (may be frame itself); a new
+             array is allocated when omitted
+
+    Returns:
+        The scaled frame (out, if given)
+    """
+    if out is None:
+        out = np.empty(frame.shape, dtype=np.uint8)
+    if np.ndim(scale) == 0:
+        _scale_frame_numpy(frame, np.uint32(scale), out)
+    else:
+        # Strided input (e.g. a padded decoder buffer) is read in place; Numba compiles a
+        # separate specialization for non-contiguous layouts instead of needing a copy
+        _scale_frame_array(frame, scale, out)
+    return out
+
+
+@functools.lru_cache(maxsize=None)
+def warm_up() -> None:
+    """
+    Compile (or load from the on-disk cache) the Numba kernels for the array types the video
+    pipeline passes, so the cost is paid while setting up a clip rather than on its first frame.
+
+    Runs once per process, and logs which kernel backend is in use; the NumPy fallback is
+    several times slower, so a deployment missing Numba gets a warning.
+    """
+    if KERNEL_BACKEND == 'numpy':
+        logger.warning("Frame kernels: Numba is unavailable, using the slower NumPy fallback")
+    else:
+        logger.info("Frame kernels: using the %s backend", KERNEL_BACKEND)
+    if not HAS_NUMBA:
+        return
+    frame = np.zeros((1, 1, 3), dtype=np.uint8)
+    scale_frame(frame, np.full((1, 1, 1), SCALE_ONE, dtype=np.uint16), np.empty_like(frame))
+    alpha_composite(frame, premultiply_alpha(np.zeros((1, 1, 4), dtype=np.uint8)), 0, 0, frame)
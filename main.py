@@ -20,7 +20,7 @@ def main():
                        help='Padding color as R,G,B (e.g., 0,0,0 for black)')
     parser.add_argument('--blur-background', action='store_true',
                        help='Use blurred video background instead of solid color (only for pad method)')
-    parser.add_argument('--quality', '-q', choices=['lossless', 'high', 'medium', 'low'],
+    parser.add_argument('--quality', '-q', choices=['lossless', 'high', 'medium', 'low', 'gpu'],
                        default='high', help='Video quality preset')
     parser.add_argument('--info', action='store_true', help='Show video info only')
     
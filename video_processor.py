@@ -1,14 +1,440 @@
 import cv2
 import numpy as np
-from moviepy.editor import VideoFileClip, concatenate_videoclips
 import os
-from typing import Tuple, Optional, Literal, List, Dict, Any
+from typing import Tuple, Optional, Literal, List, Dict, Any, Iterable, Mapping
 import tempfile
 import subprocess
 import json
 import time
 import logging
 import uuid
+import functools
+import threading
+import contextlib
+import concurrent.futures
+import errno
+import atexit
+import inspect
+import shutil
+import sys
+import dataclasses
+from dataclasses import dataclass
+from fractions import Fraction
+from types import MappingProxyType
+
+from frame_kernels import (SCALE_ONE, alpha_composite, buffer_ring, premultiply_alpha, scale_frame,
+                           warm_up as warm_up_kernels)
+
+try:
+    import av  # PyAV: in-process libav bindings for metadata probing
+except ImportError:
+    av = None
+
+try:
+    import orjson  # Faster JSON for the on-disk probe cache
+except ImportError:
+    orjson = None
+
+
+logger = logging.getLogger(__name__)
+
+
+@contextlib.contextmanager
+def _timed(label: str):
+    """Log how long the block took at DEBUG level; a no-op (no clock reads) otherwise."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        logger.debug("%s took %.4f seconds", label, time.perf_counter() - start)
+
+
+@functools.lru_cache(maxsize=None)
+def _ffprobe_executable() -> str:
+    """Absolute path of ffprobe (resolved once); subprocess only uses posix_spawn for paths with a directory."""
+    return shutil.which('ffprobe') or 'ffprobe'
+
+
+@functools.lru_cache(maxsize=32)
+def _scaled_watermark(watermark_path: str, mtime_ns: int, target_height: int) -> np.ndarray:
+    """
+    Load a watermark image as an RGBA array scaled to target_height (aspect preserved).
+    Cached per (path, mtime, height) so the same logo is only resized once per resolution.
+    """
+    from PIL import Image
+    with Image.open(watermark_path) as img:
+        img = img.convert('RGBA')
+        target_width = max(1, round(img.width * target_height / img.height))
+        scaled = np.asarray(img.resize((target_width, target_height), Image.BILINEAR))
+    scaled.flags.writeable = False  # Shared between calls
+    return scaled
+
+
+def _move_into_place(src: str, dst: str) -> None:
+    """Move a finished temp file to dst: a rename on the same filesystem, a copy across filesystems."""
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.copy2(src, dst)
+        os.remove(src)
+
+
+@functools.lru_cache(maxsize=None)
+def _check_nvenc_available() -> bool:
+    """Whether ffmpeg can encode with h264_nvenc on this machine (checked once per process)."""
+    try:
+        encoders = subprocess.run(['ffmpeg', '-hide_banner', '-encoders'],
+                                  stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=10).stdout
+        if b'h264_nvenc' not in encoders:
+            return False
+        # The encoder can be compiled in without a usable GPU/driver, so try a tiny encode
+        result = subprocess.run(['ffmpeg', '-hide_banner', '-v', 'error',
+                                 '-f', 'lavfi', '-i', 'color=size=256x256:duration=0.1',
+                                 '-c:v', 'h264_nvenc', '-f', 'null', '-'],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=20)
+        return result.returncode == 0
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+
+def _run_concurrently(func, items: List[Any]) -> List[Any]:
+    """Apply func to each item on a small thread pool, preserving order (for subprocess/IO-bound calls)."""
+    if len(items) < 2:
+        return [func(item) for item in items]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+def _without_pix_fmt(args: List[str]) -> List[str]:
+    """Drop -pix_fmt from encoder arguments; frames kept in CUDA memory must not be converted in software."""
+    if '-pix_fmt' not in args:
+        return args
+    index = args.index('-pix_fmt')
+    return args[:index] + args[index + 2:]
+
+
+# Demuxers whose streams can carry a display matrix (rotation) that PyAV cannot read, and the file
+# extensions they use: such files go straight to ffprobe without being opened with PyAV first
+_PYAV_ROTATABLE_FORMATS = frozenset({'mov', 'mp4', 'matroska'})
+_PYAV_ROTATABLE_EXTENSIONS = ('.mp4', '.m4v', '.mov', '.3gp', '.mkv', '.webm')
+
+# Input codecs NVDEC decodes on every NVENC-capable GPU; others (e.g. AV1 on pre-Ampere cards) decode on the CPU
+_NVDEC_CODECS = frozenset({'h264', 'hevc'})
+
+# Fixed ffprobe options; only the -show_entries selection and the input vary per call
+_FFPROBE_ARGS = (
+    '-v', 'quiet',                    # Suppress verbose output
+    '-print_format', 'flat',          # Flat key=value output, no JSON decode needed
+    '-probesize', '1048576',          # Limit probe size for faster analysis (1MB)
+    '-analyzeduration', '1000000',    # Limit analysis duration (1 second)
+)
+
+# ffmpeg overlay coordinates for each watermark position (20px margin, same as the MoviePy path)
+# eval=init: neither size changes mid-stream, so the position expressions are evaluated once
+# instead of on every frame (overlay's default)
+_WATERMARK_OVERLAY_POSITIONS = {
+    'top-left': "20:20:eval=init",
+    'top-right': "W-w-20:20:eval=init",
+    'bottom-left': "20:H-h-20:eval=init",
+    'bottom-right': "W-w-20:H-h-20:eval=init",
+    'center': "(W-w)/2:(H-h)/2:eval=init",
+}
+
+# Stream fields that must match across inputs for the concat demuxer to stream copy them. The
+# demuxer keeps only the first file's codec headers, so level and the extradata (H.264 SPS/PPS,
+# hashed with -show_data_hash) must match too, not just codec, profile and size
+_CONCAT_COPY_FIELDS = ('codec_type', 'codec_name', 'profile', 'level', 'width', 'height', 'pix_fmt',
+                       'avg_frame_rate', 'sample_rate', 'channels', 'extradata_hash')
+
+# Frame rates ffprobe reports most often, resolved without parsing; the values are the exact
+# quotients, so a cached rate is identical to what _parse_rate would return
+_FPS_CACHE = {
+    "30000/1001": 30000 / 1001,
+    "24000/1001": 24000 / 1001,
+    "60000/1001": 60000 / 1001,
+    "25/1": 25.0,
+    "30/1": 30.0,
+    "24/1": 24.0,
+    "50/1": 50.0,
+    "60/1": 60.0,
+}
+
+
+@dataclass(frozen=True)
+class VideoInfo:
+    """Probed video metadata; slotted and immutable so cached entries can be shared."""
+    __slots__ = ('duration', 'fps', 'width', 'height', 'aspect_ratio', 'has_audio', 'codec_name', 'rotation')
+    duration: float
+    fps: float
+    width: int
+    height: int
+    aspect_ratio: float
+    has_audio: bool
+    codec_name: str
+    rotation: int  # Display rotation in degrees (0, 90, 180 or 270)
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return (self.width, self.height)
+
+    @property
+    def display_size(self) -> Tuple[int, int]:
+        """
+        Size of the frames ffmpeg filter graphs and MoviePy actually receive: both apply the
+        rotation, so width and height are swapped for 90/270 (e.g. portrait phone videos).
+        """
+        if self.rotation in (90, 270):
+            return (self.height, self.width)
+        return (self.width, self.height)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the dictionary shape get_video_info has always returned."""
+        return {
+            'duration': self.duration,
+            'fps': self.fps,
+            'size': [self.width, self.height],
+            'aspect_ratio': self.aspect_ratio,
+            'has_audio': self.has_audio,
+            'codec_name': self.codec_name,
+            'rotation': self.rotation
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'VideoInfo':
+        width, height = data['size']
+        return cls(data['duration'], data['fps'], width, height, data['aspect_ratio'], data['has_audio'],
+                   data.get('codec_name', ''), data.get('rotation', 0))
+
+
+def _normalize_rotation(value: Any) -> int:
+    """Convert a rotate tag or display matrix angle (e.g. '90', -90.0) to 0, 90, 180 or 270."""
+    try:
+        return int(round(float(value) / 90.0)) % 4 * 90
+    except (TypeError, ValueError):
+        return 0
+
+
+# Persistent probe cache so metadata survives process restarts
+PROBE_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'videoresizer', 'probe.json')
+PROBE_CACHE_MAX_ENTRIES = 4096
+# Part of every cache key; bump it when VideoInfo gains fields so older entries are not reused
+PROBE_CACHE_VERSION = 2
+# New entries are written to disk in batches of this many (and at exit), not one file rewrite per probe
+PROBE_CACHE_FLUSH_EVERY = 32
+
+_probe_disk_cache: Optional[Dict[str, Dict[str, Any]]] = None
+_probe_disk_pending: Dict[str, Dict[str, Any]] = {}
+_probe_disk_cache_lock = threading.Lock()
+
+
+def _read_probe_cache_file() -> Dict[str, Dict[str, Any]]:
+    """Current contents of the cache file (empty if missing or unreadable)."""
+    try:
+        with open(PROBE_CACHE_PATH, 'rb') as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (OSError, ValueError):
+        return {}
+
+
+def _trim_probe_cache(cache: Dict[str, Dict[str, Any]]) -> None:
+    """Drop the oldest entries (dicts keep insertion order) to bound the cache size."""
+    while len(cache) > PROBE_CACHE_MAX_ENTRIES:
+        cache.pop(next(iter(cache)))
+
+
+def _load_probe_disk_cache() -> Dict[str, Dict[str, Any]]:
+    """Load the on-disk probe cache once per process."""
+    global _probe_disk_cache
+    if _probe_disk_cache is None:
+        _probe_disk_cache = _read_probe_cache_file()
+    return _probe_disk_cache
+
+
+def _store_probe_disk_cache(key: str, info: Dict[str, Any]) -> None:
+    """Add an entry to the probe cache; it reaches the file with the next batch (see PROBE_CACHE_FLUSH_EVERY)."""
+    with _probe_disk_cache_lock:
+        cache = _load_probe_disk_cache()
+        cache[key] = info
+        _trim_probe_cache(cache)
+        _probe_disk_pending[key] = info
+        if len(_probe_disk_pending) < PROBE_CACHE_FLUSH_EVERY:
+            return
+    _flush_probe_disk_cache()
+
+
+@atexit.register
+def _flush_probe_disk_cache() -> None:
+    """
+    Write pending entries to the cache file atomically.
+    
+    The file is re-read and the pending entries merged into it first, so entries other
+    processes wrote in the meantime are kept rather than overwritten by this process's snapshot.
+    """
+    with _probe_disk_cache_lock:
+        if not _probe_disk_pending:
+            return
+        cache = _read_probe_cache_file()
+        cache.update(_probe_disk_pending)
+        _probe_disk_pending.clear()
+        _trim_probe_cache(cache)
+        try:
+            os.makedirs(os.path.dirname(PROBE_CACHE_PATH), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(PROBE_CACHE_PATH), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps(cache) if orjson is not None else json.dumps(cache).encode())
+            os.replace(tmp_path, PROBE_CACHE_PATH)
+        except OSError as e:
+            logger.debug("Could not persist probe cache to %s: %s", PROBE_CACHE_PATH, e)
+
+
+# In-process probe results per (path, mtime, size), oldest first
+_video_info_cache: Dict[Tuple[str, int, int], VideoInfo] = {}
+_video_info_cache_lock = threading.Lock()
+VIDEO_INFO_CACHE_MAX_ENTRIES = 4096
+
+
+def _cached_video_info(abs_path: str, mtime_ns: int, size: int) -> Optional[VideoInfo]:
+    """
+    Probe a file once per (path, mtime, size); an edited file gets a new key.
+    
+    Only successful probes are cached, so a transient ffprobe failure or timeout is retried
+    on the next call instead of sticking for the rest of the process.
+    """
+    cache_key = (abs_path, mtime_ns, size)
+    info = _video_info_cache.get(cache_key)
+    if info is not None:
+        return info
+    
+    key = f"v{PROBE_CACHE_VERSION}|{abs_path}|{mtime_ns}|{size}"
+    cached = _load_probe_disk_cache().get(key)
+    if cached is not None:
+        info = VideoInfo.from_dict(cached)
+    else:
+        info = VideoProcessor._get_video_info_pyav(abs_path)
+        if not info:
+            info = VideoProcessor._get_video_info_ffprobe(abs_path)
+        if not info:
+            return None
+        _store_probe_disk_cache(key, info.as_dict())
+    
+    with _video_info_cache_lock:
+        _video_info_cache[cache_key] = info
+        while len(_video_info_cache) > VIDEO_INFO_CACHE_MAX_ENTRIES:
+            _video_info_cache.pop(next(iter(_video_info_cache)))
+    return info
+
+
+# RGB * 0.8 (the blurred background's dim) expressed on limited-range YUV
+_DIM_BACKGROUND_FILTER = "lutyuv=y='(val-16)*0.8+16':u='(val-128)*0.8+128':v='(val-128)*0.8+128'"
+
+# Parameters every preset shares for better compatibility
+_COMMON_ENCODING_PARAMS = {
+    'temp_audiofile': 'temp-audio.m4a',
+    'remove_temp': True,
+    'verbose': False,
+    'logger': None,
+}
+
+# Opt-in fragmented MP4 for outputs that are streamed while being written: the moov header goes
+# out first. Not the default, since many players, editors and upload pipelines handle fragmented
+# files (empty moov, no sample tables) poorly
+_FRAGMENTED_MP4_FLAGS = ('-movflags', '+frag_keyframe+empty_moov+default_base_moof')
+
+
+@dataclass(frozen=True)
+class EncodingPreset:
+    """An encoder configuration; its write_videofile kwargs are built once and shared read-only."""
+    __slots__ = ('codec', 'audio_codec', 'bitrate', 'ffmpeg_params', 'audio_bitrate', '_kwargs')
+    codec: str
+    audio_codec: str
+    bitrate: Optional[str]
+    ffmpeg_params: Tuple[str, ...]
+    audio_bitrate: str
+
+    def __post_init__(self):
+        kwargs = {
+            'codec': self.codec,
+            'audio_codec': self.audio_codec,
+            'bitrate': self.bitrate,
+            'ffmpeg_params': self.ffmpeg_params,
+            'audio_bitrate': self.audio_bitrate,
+            **_COMMON_ENCODING_PARAMS,
+        }
+        object.__setattr__(self, '_kwargs', MappingProxyType(kwargs))
+
+    def as_kwargs(self) -> Mapping[str, Any]:
+        """MoviePy write_videofile keyword arguments for this preset."""
+        return self._kwargs
+
+    def fragmented(self) -> 'EncodingPreset':
+        """The same preset with fragmented-MP4 movflags appended."""
+        return dataclasses.replace(self, ffmpeg_params=self.ffmpeg_params + _FRAGMENTED_MP4_FLAGS)
+
+
+# Quality presets with better concatenation support
+_ENCODING_PRESETS: Dict[str, EncodingPreset] = {
+    'lossless': EncodingPreset(
+        codec='libx264',
+        audio_codec='aac',
+        bitrate=None,  # Use original bitrate
+        ffmpeg_params=('-crf', '0', '-preset', 'veryslow', '-pix_fmt', 'yuv420p'),  # Lossless + compatibility
+        audio_bitrate='320k'
+    ),
+    'high': EncodingPreset(
+        codec='libx264',
+        audio_codec='aac',
+        bitrate=None,  # Use original or auto-detect
+        ffmpeg_params=('-crf', '18', '-preset', 'slow', '-pix_fmt', 'yuv420p'),  # Near-lossless + compatibility
+        audio_bitrate='192k'
+    ),
+    'medium': EncodingPreset(
+        codec='libx264',
+        audio_codec='aac',
+        bitrate='5000k',
+        ffmpeg_params=('-crf', '23', '-preset', 'medium', '-pix_fmt', 'yuv420p'),
+        audio_bitrate='128k'
+    ),
+    'low': EncodingPreset(
+        codec='libx264',
+        audio_codec='aac',
+        bitrate='2000k',
+        ffmpeg_params=('-crf', '28', '-preset', 'fast', '-pix_fmt', 'yuv420p'),
+        audio_bitrate='96k'
+    ),
+    'gpu': EncodingPreset(
+        codec='h264_nvenc',
+        audio_codec='aac',
+        bitrate=None,  # Constant quality (-cq) below; -b:v 0 lifts NVENC's default bitrate cap
+        ffmpeg_params=('-preset', 'p4', '-tune', 'hq', '-rc', 'vbr', '-cq', '23', '-b:v', '0', '-pix_fmt', 'yuv420p'),
+        audio_bitrate='192k'
+    ),
+}
+
+_FRAGMENTED_MP4_PRESETS: Dict[str, EncodingPreset] = {
+    name: preset.fragmented() for name, preset in _ENCODING_PRESETS.items()
+}
+
+# Intermediate lossless files for fast concatenation: -qp 0 for true lossless with a faster
+# preset; callers store them in .mkv, which is flexible for concat
+_INTERMEDIATE_LOSSLESS_PRESET = EncodingPreset(
+    codec='libx264',
+    audio_codec='aac',  # Changed from pcm_s16le to aac for better stability
+    bitrate=None,
+    ffmpeg_params=('-qp', '0', '-preset', 'ultrafast', '-pix_fmt', 'yuv420p'),
+    audio_bitrate='320k'  # High bitrate AAC
+)
+
+
+def _show_progress_bar() -> bool:
+    """MoviePy's progress bar writes to stderr every frame; only show it to a person debugging in a terminal."""
+    return sys.stderr.isatty() and os.environ.get('DEBUG') == '1'
+
 
 class VideoProcessor:
     """
@@ -21,7 +447,7 @@ class VideoProcessor:
         Initialize VideoProcessor with quality settings.
         
         Args:
-            quality_preset: Quality preset ('lossless', 'high', 'medium', 'low', 'custom')
+            quality_preset: Quality preset ('lossless', 'high', 'medium', 'low', 'gpu', 'custom')
         """
         self.supported_formats = ['.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv']
         self.quality_preset = quality_preset
@@ -29,100 +455,112 @@ class VideoProcessor:
     def get_encoding_params(self, 
                            quality_preset: Optional[str] = None, 
                            custom_params: Optional[Dict[str, Any]] = None,
-                           is_intermediate_for_concat: bool = False) -> Dict[str, Any]:
+                           is_intermediate_for_concat: bool = False,
+                           fragmented_mp4: bool = False) -> Mapping[str, Any]:
         """
         Get encoding parameters based on quality preset with improved defaults for concatenation.
         
         Args:
             quality_preset: Override the instance quality preset. 
-                            Can be 'lossless', 'high', 'medium', 'low', or 'intermediate_lossless'.
+                            Can be 'lossless', 'high', 'medium', 'low', 'gpu', or 'intermediate_lossless'.
+                            'gpu' (NVENC) falls back to 'high' when no usable NVIDIA encoder is found.
             custom_params: Custom encoding parameters to override defaults
             is_intermediate_for_concat: If True and quality_preset is 'lossless', uses parameters
                                          optimized for intermediate files meant for fast concatenation.
+            fragmented_mp4: Write fragmented MP4 (for MP4/MOV outputs that are streamed while
+                            being written); off by default, normal MP4 is the most compatible.
         
         Returns:
-            Dictionary of encoding parameters for MoviePy
+            Encoding parameters for MoviePy. Without custom_params this is a shared read-only
+            mapping; with custom_params it is a new dict.
         """
         preset_to_use = quality_preset or self.quality_preset
         
-        if is_intermediate_for_concat and preset_to_use == 'lossless':
-            # Special parameters for intermediate lossless files for fast concatenation
-            # Using -qp 0 for true lossless, and a faster preset.
-            # Audio codec PCM for better concat compatibility.
-            # MKV container is often more flexible for concatenation.
-            intermediate_params = {
-                'codec': 'libx264',
-                'audio_codec': 'aac', # Changed from pcm_s16le to aac for better stability
-                'ffmpeg_params': ['-qp', '0', '-preset', 'ultrafast', '-pix_fmt', 'yuv420p'],
-                'audio_bitrate': '320k', # High bitrate AAC
-                'container': '.mkv' # MKV is flexible for concat
-            }
-            # Apply common parameters
-            intermediate_params.update({
-                'temp_audiofile': 'temp-audio.m4a', # Use .m4a for AAC
-                'remove_temp': True,
-                'verbose': False,
-                'logger': None,
-                'write_logfile': False,
-            })
-            if custom_params:
-                intermediate_params.update(custom_params)
-            return intermediate_params
-
-        # Define quality presets with better concatenation support
-        presets = {
-            'lossless': {
-                'codec': 'libx264',
-                'audio_codec': 'aac',
-                'bitrate': None,  # Use original bitrate
-                'ffmpeg_params': ['-crf', '0', '-preset', 'veryslow', '-pix_fmt', 'yuv420p'],  # Lossless + compatibility
-                'audio_bitrate': '320k'
-            },
-            'high': {
-                'codec': 'libx264', 
-                'audio_codec': 'aac',
-                'bitrate': None,  # Use original or auto-detect
-                'ffmpeg_params': ['-crf', '18', '-preset', 'slow', '-pix_fmt', 'yuv420p'],  # Near-lossless + compatibility
-                'audio_bitrate': '192k'
-            },
-            'medium': {
-                'codec': 'libx264',
-                'audio_codec': 'aac', 
-                'bitrate': '5000k',
-                'ffmpeg_params': ['-crf', '23', '-preset', 'medium', '-pix_fmt', 'yuv420p'],
-                'audio_bitrate': '128k'
-            },
-            'low': {
-                'codec': 'libx264',
-                'audio_codec': 'aac',
-                'bitrate': '2000k', 
-                'ffmpeg_params': ['-crf', '28', '-preset', 'fast', '-pix_fmt', 'yuv420p'],
-                'audio_bitrate': '96k'
-            }
-        }
+        if preset_to_use == 'gpu' and not _check_nvenc_available():
+            logger.info("NVENC not available, using the 'high' preset instead of 'gpu'")
+            preset_to_use = 'high'
         
-        # Get base parameters
-        if preset_to_use in presets:
-            params = presets[preset_to_use].copy()
+        if is_intermediate_for_concat and preset_to_use == 'lossless':
+            params = _INTERMEDIATE_LOSSLESS_PRESET.as_kwargs()
         else:
+            presets = _FRAGMENTED_MP4_PRESETS if fragmented_mp4 else _ENCODING_PRESETS
             # Default to high quality
-            params = presets['high'].copy()
-        
-        # Add common parameters for better compatibility
-        params.update({
-            'temp_audiofile': 'temp-audio.m4a',
-            'remove_temp': True,
-            'verbose': False,
-            'logger': None,
-            'write_logfile': False,  # Disable log file creation
-        })
+            params = presets.get(preset_to_use, presets['high']).as_kwargs()
         
         # Apply custom overrides
         if custom_params:
-            params.update(custom_params)
-            
+            return {**params, **custom_params}
         return params
     
+    def get_encoding_params_as_cli(self,
+                                   quality_preset: Optional[str] = None,
+                                   custom_params: Optional[Dict[str, Any]] = None,
+                                   is_intermediate_for_concat: bool = False,
+                                   include_audio: bool = False,
+                                   fragmented_mp4: bool = False) -> List[str]:
+        """
+        Get the encoding parameters of a preset as ffmpeg command-line arguments.
+        
+        Args:
+            quality_preset: Override the instance quality preset
+            custom_params: Custom encoding parameters to override defaults
+            is_intermediate_for_concat: Same as for get_encoding_params
+            include_audio: Also emit the preset's audio codec and bitrate
+            fragmented_mp4: Same as for get_encoding_params
+        
+        Returns:
+            List of ffmpeg arguments (codec, bitrate and extra ffmpeg_params; audio only if requested)
+        """
+        params = self.get_encoding_params(quality_preset=quality_preset, custom_params=custom_params,
+                                          is_intermediate_for_concat=is_intermediate_for_concat,
+                                          fragmented_mp4=fragmented_mp4)
+        args = ['-c:v', params['codec']]
+        if params.get('bitrate'):
+            args += ['-b:v', params['bitrate']]
+        args += list(params.get('ffmpeg_params') or [])
+        if include_audio:
+            args += ['-c:a', params['audio_codec']]
+            if params.get('audio_bitrate'):
+                args += ['-b:a', params['audio_bitrate']]
+        return args
+    
+    def _uses_nvenc(self, quality_preset: Optional[str] = None) -> bool:
+        """Whether the preset resolves to the NVENC encoder on this machine."""
+        return self.get_encoding_params(quality_preset)['codec'] == 'h264_nvenc'
+    
+    def _hwaccel_input_args(self, input_path: str, quality_preset: Optional[str] = None) -> List[str]:
+        """
+        ffmpeg input options enabling NVDEC decoding when encoding with NVENC.
+        
+        Only used for codecs every NVENC GPU can decode; AV1 and others stay on the CPU decoder.
+        """
+        if not self._uses_nvenc(quality_preset):
+            return []
+        info = self._probe_video_info(input_path)
+        if info is None or info.codec_name not in _NVDEC_CODECS:
+            return []
+        return ['-hwaccel', 'cuda']
+    
+    @staticmethod
+    def _run_ffmpeg(command: List[str], description: str) -> bool:
+        """
+        Run an ffmpeg command, logging stderr on failure.
+        
+        Returns:
+            bool: True if ffmpeg exited successfully, False otherwise
+        """
+        if logger.isEnabledFor(logging.INFO):  # Only join the command line when it will be logged
+            logger.info("Executing FFmpeg %s: %s", description, ' '.join(command))
+        try:
+            result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        except OSError as e:
+            logger.error("Could not run ffmpeg for %s: %s", description, e)
+            return False
+        if result.returncode != 0:
+            logger.error("FFmpeg %s failed. StdErr: %s", description, result.stderr.decode(errors='ignore'))
+            return False
+        return True
+
     def resize_aspect_ratio(self, 
                            input_path: str, 
                            output_path: str,
@@ -160,34 +598,45 @@ class VideoProcessor:
             if not self._validate_input(input_path):
                 return False
             
-            print(f"🎬 Starting video processing...")
-            # Load video
+            logger.info("Starting video processing...")
+            
+            # Crop and stretch need nothing but the hardware decoder's own crop/resize
+            if (resize_method in ('crop', 'stretch') and not is_intermediate_for_concat
+                    and self._uses_nvenc(quality_preset)):
+                if self._resize_aspect_ratio_nvdec(input_path, output_path, target_ratio, resize_method, quality_preset):
+                    logger.info("Video successfully processed on the GPU and saved to: %s", output_path)
+                    return True
+                logger.warning("GPU resize failed or not applicable, using MoviePy")
+            
+            # Blurred letterboxing without a gradient can run entirely on the GPU
+            if (resize_method == 'pad' and blur_background and gradient_blend < 0.05
+                    and not is_intermediate_for_concat and self._uses_nvenc(quality_preset)):
+                if self._pad_to_ratio_blur_cuda(input_path, output_path, target_ratio, blur_strength, quality_preset):
+                    logger.info("Video successfully processed on the GPU and saved to: %s", output_path)
+                    return True
+                logger.warning("GPU blur background failed or not applicable, using MoviePy")
+            
+            # Otherwise the whole blurred letterbox is one ffmpeg filter graph on the CPU
+            if resize_method == 'pad' and blur_background and not is_intermediate_for_concat:
+                if self._pad_to_ratio_blur_ffmpeg(input_path, output_path, target_ratio, blur_strength,
+                                                  gradient_blend, quality_preset):
+                    logger.info("Video successfully processed with FFmpeg and saved to: %s", output_path)
+                    return True
+                logger.warning("FFmpeg blur background failed or not applicable, using MoviePy")
+            
+            # Load video (MoviePy is only imported once a path actually needs it)
+            from moviepy.editor import VideoFileClip
             clip = VideoFileClip(input_path)
-            original_width, original_height = clip.size
-            original_ratio = original_width / original_height
-            target_ratio_decimal = target_ratio[0] / target_ratio[1]
-            
-            print(f"Original dimensions: {original_width}x{original_height}")
-            print(f"Original ratio: {original_ratio:.2f}")
-            print(f"Target ratio: {target_ratio_decimal:.2f}")
-            print(f"Quality preset: {quality_preset or self.quality_preset}")
+            logger.debug("Quality preset: %s", quality_preset or self.quality_preset)
+            processed_clip = self.resize_clip(clip, target_ratio, resize_method, pad_color,
+                                                            blur_background, blur_strength, gradient_blend)
             
-            # Process based on resize method
-            print(f"🔄 Processing video using {resize_method} method...")
-            if resize_method == 'crop':
-                processed_clip = self._crop_to_ratio(clip, target_ratio)
-            elif resize_method == 'pad':
-                processed_clip = self._pad_to_ratio(clip, target_ratio, pad_color, blur_background, blur_strength, gradient_blend)
-            elif resize_method == 'stretch':
-                processed_clip = self._stretch_to_ratio(clip, target_ratio)
-            else:
-                raise ValueError(f"Unsupported resize method: {resize_method}")
+            logger.info("Video processing completed. Starting video export...")
             
-            print(f"✅ Video processing completed. Starting video export...")
-            
-            # Get encoding parameters
+            # Get encoding parameters (quiet unless a progress bar was asked for)
             encoding_params = self.get_encoding_params(
                 quality_preset=(quality_preset or self.quality_preset),
+                custom_params={'logger': 'bar'} if _show_progress_bar() else None,
                 is_intermediate_for_concat=is_intermediate_for_concat
             )
             
@@ -196,62 +645,224 @@ class VideoProcessor:
             if is_intermediate_for_concat and (quality_preset or self.quality_preset) == 'lossless':
                 base, _ = os.path.splitext(output_path)
                 actual_output_path = base + ".mkv"
-                logging.info(f"Intermediate lossless resize: saving as {actual_output_path}")
-            
-            # Add progress callback for debugging
-            def progress_callback(t):
-                if hasattr(progress_callback, 'last_print') and t - progress_callback.last_print < 5:
-                    return  # Only print every 5 seconds
-                progress_callback.last_print = t
-                print(f"⏳ Encoding progress: {t:.1f}s processed...")
-            
-            progress_callback.last_print = 0
+                logger.info("Intermediate lossless resize: saving as %s", actual_output_path)
             
-            # Write output with quality settings and progress tracking
-            print(f"💾 Writing video file: {actual_output_path}")
-            print(f"📝 Encoding parameters: {encoding_params}")
-            
-            # Remove conflicting parameters and set our preferred values
-            params_for_write = encoding_params.copy() # Use a new variable for clarity
-            params_for_write['verbose'] = True     # Enable verbose output for debugging
-            params_for_write['logger'] = 'bar'     # Use bar logger for progress
-            params_for_write.pop('container', None) # Remove 'container' key if it exists
+            # Write output with quality settings
+            logger.debug("Writing video file: %s", actual_output_path)
+            logger.debug("Encoding parameters: %s", encoding_params)
             
             try:
-                processed_clip.write_videofile(
-                    actual_output_path, 
-                    **params_for_write # Use the cleaned parameters
-                )
-                print(f"✅ Video file written successfully!")
+                processed_clip.write_videofile(actual_output_path, **encoding_params)
+                logger.debug("Video file written successfully")
             except Exception as write_error:
-                print(f"❌ Error during video writing: {str(write_error)}")
-                print(f"🔍 Write error type: {type(write_error).__name__}")
-                import traceback
-                traceback.print_exc()
+                logger.error("Error during video writing: %s: %s", type(write_error).__name__, write_error)
                 raise write_error
             
             # Clean up
-            print(f"🧹 Cleaning up video clips...")
+            logger.debug("Cleaning up video clips...")
             clip.close()
             processed_clip.close()
             
-            print(f"Video successfully processed and saved to: {actual_output_path}")
+            logger.info("Video successfully processed and saved to: %s", actual_output_path)
             return True
             
         except Exception as e:
-            print(f"Error processing video: {str(e)}")
-            print(f"🔍 Error type: {type(e).__name__}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error processing video: %s", e)
             return False
 
+    def resize_aspect_ratio_many(self,
+                                 input_path: str,
+                                 variants: Mapping[str, Dict[str, Any]],
+                                 quality_preset: Optional[str] = None) -> bool:
+        """
+        Write several resized versions of one video while decoding it only once.
+        
+        Normally a single ffmpeg run splits the decoded video into one filter chain per output
+        (the same filters resize_aspect_ratio's ffmpeg paths use). If that fails, the outputs are
+        encoded side by side from one MoviePy clip instead. Outputs are written under temporary
+        names and only renamed into place once all of them succeeded.
+        
+        Args:
+            input_path: Path to input video file
+            variants: Output path -> resize_clip keyword arguments (target_ratio, resize_method, ...)
+            quality_preset: Override quality preset for all outputs
+        
+        Returns:
+            bool: True if every output was written, False otherwise
+        """
+        if not self._validate_input(input_path):
+            return False
+        
+        # Temporary names keep the extension (ffmpeg picks the container from it)
+        targets = [(os.path.join(os.path.dirname(os.path.abspath(path)), f".tmp_{uuid.uuid4().hex}_{os.path.basename(path)}"),
+                    options) for path, options in variants.items()]
+        try:
+            if self._resize_many_ffmpeg(input_path, targets, quality_preset):
+                logger.info("Video successfully processed with FFmpeg into %s outputs", len(targets))
+            else:
+                logger.warning("FFmpeg multi-output resize failed, using MoviePy")
+                if not self._resize_many_moviepy(input_path, targets, quality_preset):
+                    return False
+                logger.info("Video successfully processed into %s outputs", len(targets))
+            for (temp_path, _), path in zip(targets, variants):
+                _move_into_place(temp_path, path)
+            return True
+        finally:
+            # Partial outputs of a failed run (moved files are already gone)
+            for temp_path, _ in targets:
+                with contextlib.suppress(OSError):
+                    os.remove(temp_path)
+    
+    def _resize_many_ffmpeg(self,
+                            input_path: str,
+                            targets: List[Tuple[str, Dict[str, Any]]],
+                            quality_preset: Optional[str] = None) -> bool:
+        """
+        Write every variant in one ffmpeg run: the decoded video is split into one filter chain
+        per output and the audio stream is mapped into each of them.
+        
+        Args:
+            targets: (output path, resize_clip keyword arguments) pairs
+        
+        Returns:
+            bool: True if successful, False if the input cannot be probed or ffmpeg failed
+        """
+        info = self._probe_video_info(input_path)
+        if info is None:
+            return False
+        # Frames reach the graph already auto-rotated, so work from the displayed size
+        width, height = info.display_size
+        signature = inspect.signature(self.resize_clip)
+        encode_args = self.get_encoding_params_as_cli(quality_preset=quality_preset, include_audio=True)
+        
+        filters = [f"[0:v]split={len(targets)}{''.join(f'[s{i}]' for i in range(len(targets)))}"]
+        mask_args = []
+        output_args = []
+        with tempfile.TemporaryDirectory() as mask_dir:
+            for i, (path, options) in enumerate(targets):
+                # Same argument handling (defaults, unknown keys) as resize_clip
+                bound = signature.bind(None, **options)
+                bound.apply_defaults()
+                args = bound.arguments
+                
+                graph = None
+                if args['resize_method'] == 'pad' and args['blur_background']:
+                    graph = self._blur_pad_graph((width, height), args['target_ratio'], args['blur_strength'],
+                                                 args['gradient_blend'], f"[s{i}]", f"v{i}",
+                                                 mask_dir, 1 + len(mask_args) // 4)
+                if graph is not None:
+                    filter_graph, mask_path = graph
+                    filters.append(filter_graph)
+                    if mask_path:
+                        mask_args += ['-loop', '1', '-i', mask_path]
+                else:
+                    ratio_filter, _ = self._ratio_filter(width, height, args['target_ratio'], args['resize_method'],
+                                                         args['pad_color'])
+                    filters.append(f"[s{i}]{ratio_filter or 'null'},setsar=1[v{i}]")
+                output_args += ['-map', f"[v{i}]", '-map', '0:a?', *encode_args, path]
+            
+            command = ['ffmpeg', '-y', '-i', input_path, *mask_args,
+                       '-filter_complex', ';'.join(filters), *output_args]
+            return self._run_ffmpeg(command, "multi-output resize")
+    
+    def _resize_many_moviepy(self,
+                             input_path: str,
+                             targets: List[Tuple[str, Dict[str, Any]]],
+                             quality_preset: Optional[str] = None) -> bool:
+        """
+        Encode every variant side by side from one MoviePy clip.
+        
+        For each frame time every variant asks the shared source clip for the same frame, which
+        its reader decodes once and then returns again. The audio track is also encoded once and
+        copied into every output.
+        
+        Args:
+            targets: (output path, resize_clip keyword arguments) pairs
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        from moviepy.editor import VideoFileClip
+        from moviepy.video.io.ffmpeg_writer import FFMPEG_VideoWriter
+        
+        clip = VideoFileClip(input_path)
+        writers = []
+        try:
+            outputs = [(path, self.resize_clip(clip, **options)) for path, options in targets]
+            params = self.get_encoding_params(quality_preset=quality_preset)
+            
+            with tempfile.TemporaryDirectory(prefix='videoresizer_') as temp_dir:
+                audio_path = None
+                if clip.audio is not None:
+                    audio_path = os.path.join(temp_dir, 'audio.m4a')
+                    clip.audio.write_audiofile(audio_path, codec=params['audio_codec'],
+                                               bitrate=params.get('audio_bitrate'), logger=None)
+                
+                for path, processed_clip in outputs:
+                    logger.debug("Writing video file: %s", path)
+                    writers.append(FFMPEG_VideoWriter(path, processed_clip.size, clip.fps, codec=params['codec'],
+                                                      bitrate=params.get('bitrate'), audiofile=audio_path,
+                                                      ffmpeg_params=list(params.get('ffmpeg_params') or [])))
+                
+                for t in np.arange(0, clip.duration, 1.0 / clip.fps):
+                    for writer, (_, processed_clip) in zip(writers, outputs):
+                        writer.write_frame(processed_clip.get_frame(t))
+                
+                for writer in writers:
+                    writer.close()
+                writers = []
+            return True
+            
+        except Exception as e:
+            logger.exception("Error processing video: %s", e)
+            return False
+        
+        finally:
+            for writer in writers:
+                writer.close()
+            clip.close()
+    
+    def resize_clip(self,
+                    clip,
+                    target_ratio: Tuple[int, int],
+                    resize_method: Literal['crop', 'pad', 'stretch'] = 'crop',
+                    pad_color: Tuple[int, int, int] = (0, 0, 0),
+                    blur_background: bool = False,
+                    blur_strength: int = 25,
+                    gradient_blend: float = 0.3):
+        """
+        Change the aspect ratio of an already loaded MoviePy clip (see resize_aspect_ratio for
+        the arguments). The same source clip can be passed to several calls.
+        
+        Returns:
+            The processed clip
+        """
+        original_width, original_height = clip.size
+        original_ratio = original_width / original_height
+        target_ratio_decimal = target_ratio[0] / target_ratio[1]
+        
+        logger.debug("Original dimensions: %sx%s", original_width, original_height)
+        logger.debug("Original ratio: %.2f", original_ratio)
+        logger.debug("Target ratio: %.2f", target_ratio_decimal)
+        
+        # Process based on resize method
+        logger.debug("Processing video using %s method...", resize_method)
+        if resize_method == 'crop':
+            return self._crop_to_ratio(clip, target_ratio)
+        if resize_method == 'pad':
+            return self._pad_to_ratio(clip, target_ratio, pad_color, blur_background, blur_strength, gradient_blend)
+        if resize_method == 'stretch':
+            return self._stretch_to_ratio(clip, target_ratio)
+        raise ValueError(f"Unsupported resize method: {resize_method}")
+
     def crop_video_by_time(self, 
                           input_path: str, 
                           output_path: str,
                           start_time: float, 
                           end_time: float,
                           quality_preset: Optional[str] = None,
-                          is_intermediate_for_concat: bool = False) -> bool:
+                          is_intermediate_for_concat: bool = False,
+                          stream_copy: bool = False) -> bool:
         """
         Crop video by time (trim video).
         
@@ -260,8 +871,10 @@ class VideoProcessor:
             output_path: Path for output video file
             start_time: Start time in seconds
             end_time: End time in seconds
-            quality_preset: Override quality preset ('lossless', 'high', 'medium', 'low')
+            quality_preset: Override quality preset ('lossless', 'high', 'medium', 'low', 'gpu')
             is_intermediate_for_concat: If True and quality is lossless, it will get appropriate encoding parameters and save the output as .mkv
+            stream_copy: If True, copy the streams instead of re-encoding. Much faster, but the cut
+                         starts at the keyframe at or before start_time.
         
         Returns:
             bool: True if successful, False otherwise
@@ -270,23 +883,38 @@ class VideoProcessor:
             if not self._validate_input(input_path):
                 return False
             
+            # Trimming needs no filtering, so let ffmpeg seek and encode directly when it can
+            info = self._probe_video_info(input_path)
+            if info is not None:
+                ffmpeg_start = max(start_time, 0)
+                ffmpeg_end = min(end_time, info.duration) if info.duration > 0 else end_time
+                if ffmpeg_start < ffmpeg_end:
+                    actual_output_path = output_path
+                    if is_intermediate_for_concat and (quality_preset or self.quality_preset) == 'lossless':
+                        actual_output_path = os.path.splitext(output_path)[0] + ".mkv"
+                    if stream_copy:
+                        if self._crop_video_by_time_ffmpeg(input_path, actual_output_path, ffmpeg_start, ffmpeg_end,
+                                                           stream_copy=True):
+                            logger.info("Video cropped (stream copy) from %ss to %ss and saved to: %s", ffmpeg_start, ffmpeg_end, actual_output_path)
+                            return True
+                        logger.warning("FFmpeg stream copy crop failed. Re-encoding instead.")
+                    if self._crop_video_by_time_ffmpeg(input_path, actual_output_path, ffmpeg_start, ffmpeg_end,
+                                                       quality_preset, is_intermediate_for_concat):
+                        logger.info("Video cropped from %ss to %ss and saved to: %s", ffmpeg_start, ffmpeg_end, actual_output_path)
+                        return True
+                    logger.warning("FFmpeg time crop failed. Falling back to MoviePy method.")
+            
+            from moviepy.editor import VideoFileClip
             clip = VideoFileClip(input_path)
             
-            # Validate time range
-            if start_time < 0:
-                start_time = 0
-            if end_time > clip.duration:
-                end_time = clip.duration
-            if start_time >= end_time:
-                print("Error: Start time must be less than end time")
+            # Crop the video
+            try:
+                cropped_clip = self._crop_by_time_clip(clip, start_time, end_time)
+            except ValueError as e:
+                logger.error("Error: %s", e)
                 clip.close()
                 return False
-            
-            print(f"Cropping video from {start_time}s to {end_time}s")
-            print(f"Quality preset: {quality_preset or self.quality_preset}")
-            
-            # Crop the video
-            cropped_clip = clip.subclip(start_time, end_time)
+            logger.debug("Quality preset: %s", quality_preset or self.quality_preset)
             
             # Get encoding parameters, considering if it's an intermediate lossless file
             encoding_params = self.get_encoding_params(
@@ -300,33 +928,95 @@ class VideoProcessor:
                 # Ensure .mkv extension for intermediate lossless files
                 base, _ = os.path.splitext(output_path)
                 actual_output_path = base + ".mkv"
-                logging.info(f"Intermediate lossless crop: saving as {actual_output_path}")
-            
-            # Clean params for write_videofile by removing 'container' key if it exists
-            params_for_write = encoding_params.copy()
-            params_for_write.pop('container', None)
+                logger.info("Intermediate lossless crop: saving as %s", actual_output_path)
             
             # Write output with quality settings
-            cropped_clip.write_videofile(actual_output_path, **params_for_write)
+            cropped_clip.write_videofile(actual_output_path, **encoding_params)
             
             # Clean up
             clip.close()
             cropped_clip.close()
             
-            print(f"Video cropped from {start_time}s to {end_time}s and saved to: {actual_output_path}")
+            logger.info("Video cropped and saved to: %s", actual_output_path)
             return True
             
         except Exception as e:
-            print(f"Error cropping video: {str(e)}")
+            logger.error("Error cropping video: %s", e)
             return False
 
-    def _optimize_video_for_processing(self, clip, max_dimension: int = 1920):
+    @staticmethod
+    def _crop_by_time_clip(clip, start_time: float, end_time: float):
+        """
+        Trim an in-memory clip; the range is clamped to the clip's duration.
+        
+        Raises:
+            ValueError: if the clamped range is empty
+        """
+        start_time = max(start_time, 0)
+        end_time = min(end_time, clip.duration)
+        if start_time >= end_time:
+            raise ValueError("Start time must be less than end time")
+        logger.debug("Cropping video from %ss to %ss", start_time, end_time)
+        return clip.subclip(start_time, end_time)
+
+    def _crop_video_by_time_ffmpeg(self,
+                                   input_path: str,
+                                   output_path: str,
+                                   start_time: float,
+                                   end_time: float,
+                                   quality_preset: Optional[str] = None,
+                                   is_intermediate_for_concat: bool = False,
+                                   stream_copy: bool = False) -> bool:
+        """
+        Trim a video with a single ffmpeg call (NVDEC/NVENC for the 'gpu' preset).
+        
+        -ss before -i seeks through the container index instead of decoding from the start;
+        when re-encoding ffmpeg still cuts frame-accurately. With stream_copy nothing is
+        decoded and the cut snaps to the preceding keyframe.
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if stream_copy:
+            command = [
+                'ffmpeg', '-y',
+                '-ss', str(start_time),
+                '-i', input_path,
+                '-t', str(end_time - start_time),  # Input seeking resets timestamps to 0
+                '-map', '0:v:0',
+                '-map', '0:a:0?',
+                '-c', 'copy',
+                '-avoid_negative_ts', 'make_zero',
+                output_path
+            ]
+            return self._run_ffmpeg(command, "stream copy time crop")
+        
+        command = [
+            'ffmpeg', '-y',
+            *self._hwaccel_input_args(input_path, quality_preset),
+            '-ss', str(start_time),
+            '-to', str(end_time),
+            '-i', input_path,
+            '-map', '0:v:0',
+            '-map', '0:a:0?',  # Keep audio if present
+            *self.get_encoding_params_as_cli(quality_preset=quality_preset,
+                                             is_intermediate_for_concat=is_intermediate_for_concat,
+                                             include_audio=True),
+            output_path
+        ]
+        return self._run_ffmpeg(command, "time crop")
+
+    def _optimize_video_for_processing(self, clip, max_dimension: int = 1920, work_dir: Optional[str] = None,
+                                       quality_preset: Optional[str] = None):
         """
         Optimize video for processing by downscaling if necessary to prevent memory issues.
         
         Args:
             clip: VideoFileClip to optimize
             max_dimension: Maximum dimension (width or height) allowed
+            work_dir: Directory for a GPU-downscaled copy of the file; when given and quality_preset
+                      resolves to NVENC, the downscale runs on the GPU instead of per frame in MoviePy
+            quality_preset: The preset the final output is encoded with
             
         Returns:
             Optimized VideoFileClip
@@ -342,29 +1032,74 @@ class VideoProcessor:
             new_width = new_width if new_width % 2 == 0 else new_width - 1
             new_height = new_height if new_height % 2 == 0 else new_height - 1
             
-            print(f"🔧 Optimizing video: {width}x{height} → {new_width}x{new_height} (scale: {scale_factor:.2f})")
+            logger.debug("Optimizing video: %sx%s → %sx%s (scale: %.2f)", width, height, new_width, new_height, scale_factor)
+            if work_dir and getattr(clip, 'filename', None):
+                scaled_path = os.path.join(work_dir, f"optimized_{uuid.uuid4().hex}.mp4")
+                if self._scale_video_cuda(clip.filename, scaled_path, new_width, new_height, quality_preset):
+                    from moviepy.editor import VideoFileClip
+                    clip.close()
+                    return VideoFileClip(scaled_path)
             return clip.resize(newsize=(new_width, new_height))
         
         return clip
 
+    def _scale_video_cuda(self, input_path: str, output_path: str, width: int, height: int,
+                          quality_preset: Optional[str] = None) -> bool:
+        """
+        Downscale a video with NVDEC, scale_cuda and NVENC (audio is stream-copied).
+        
+        Only used when quality_preset itself resolves to NVENC: the intermediate is lossy, which
+        is fine for a 'gpu' output but not for e.g. 'lossless' or 'high'.
+        
+        Returns:
+            bool: True if successful, False if the preset is not NVENC, NVDEC cannot decode the
+            input, the input is rotated or ffmpeg failed
+        """
+        if not self._uses_nvenc(quality_preset):
+            return False
+        # Frames stay on the GPU, where ffmpeg cannot auto-rotate them
+        info = self._probe_video_info(input_path)
+        if info is None or info.rotation:
+            return False
+        hwaccel_args = self._hwaccel_input_args(input_path, quality_preset)
+        if not hwaccel_args:
+            return False
+        command = [
+            'ffmpeg', '-y',
+            *hwaccel_args, '-hwaccel_output_format', 'cuda',
+            '-i', input_path,
+            '-vf', f"scale_cuda={width}:{height}",
+            '-map', '0:v:0',
+            '-map', '0:a?',
+            *_without_pix_fmt(self.get_encoding_params_as_cli(quality_preset=quality_preset)),
+            '-c:a', 'copy',
+            output_path
+        ]
+        return self._run_ffmpeg(command, "CUDA downscale")
+
     def concatenate_videos(self, 
                           video_paths: List[str], 
                           output_path: str,
-                          quality_preset: Optional[str] = None) -> bool:
+                          quality_preset: Optional[str] = None,
+                          stream_copy: bool = False) -> bool:
         """
         Concatenate multiple videos into one with improved handling for different formats and memory optimization.
         
         Args:
             video_paths: List of paths to video files to concatenate
             output_path: Path for output video file
-            quality_preset: Override quality preset ('lossless', 'high', 'medium', 'low')
+            quality_preset: Override quality preset ('lossless', 'high', 'medium', 'low', 'gpu')
+            stream_copy: If True and all inputs share the same stream layout and codec headers, join
+                         them without re-encoding. Much faster, but the inputs keep their own encoding
+                         instead of quality_preset's.
         
         Returns:
             bool: True if successful, False otherwise
         """
+        work_dir = None
         try:
             if len(video_paths) < 2:
-                print("Error: Need at least 2 videos to concatenate")
+                logger.error("Error: Need at least 2 videos to concatenate")
                 return False
             
             # Validate all input files
@@ -372,8 +1107,8 @@ class VideoProcessor:
                 if not self._validate_input(path):
                     return False
             
-            print(f"Concatenating {len(video_paths)} videos")
-            print(f"Quality preset: {quality_preset or self.quality_preset}")
+            logger.debug("Concatenating %s videos", len(video_paths))
+            logger.debug("Quality preset: %s", quality_preset or self.quality_preset)
             
             # Attempt direct FFmpeg stream copy for lossless concatenation if applicable
             if (quality_preset or self.quality_preset) == 'lossless':
@@ -381,90 +1116,78 @@ class VideoProcessor:
                 # This is a heuristic; ideally, we'd have more robust tracking of intermediate formats.
                 are_all_mkv = all(path.lower().endswith('.mkv') for path in video_paths)
                 if are_all_mkv:
-                    logging.info("All inputs are MKV, attempting FFmpeg direct lossless concatenation.")
-                    if self._concatenate_videos_ffmpeg_lossless(video_paths, output_path):
+                    logger.info("All inputs are MKV, attempting FFmpeg direct lossless concatenation.")
+                    if self._concat_demux(video_paths, output_path):
                         # If FFmpeg direct concat is successful, we might need to handle audio separately
                         # if MoviePy was expecting to manage it. For now, assume it's fine.
-                        logging.info(f"✅ FFmpeg direct lossless concatenation successful for: {output_path}")
+                        logger.info("FFmpeg direct lossless concatenation successful for: %s", output_path)
                         return True
                     else:
-                        logging.warning("FFmpeg direct lossless concatenation failed. Falling back to MoviePy method.")
+                        logger.warning("FFmpeg direct lossless concatenation failed. Falling back to MoviePy method.")
                 else:
-                    logging.warning("Not all inputs are MKV for lossless preset. Using MoviePy for concatenation. This might be slow.")
+                    logger.warning("Not all inputs are MKV for lossless preset. Using MoviePy for concatenation. This might be slow.")
+            
+            # Inputs with identical stream layouts (e.g. outputs of our own pipeline) can be
+            # joined without decoding or encoding anything
+            if stream_copy:
+                signatures = _run_concurrently(self._stream_signature, video_paths)
+                if signatures[0] and all(sig == signatures[0] for sig in signatures[1:]):
+                    logger.info("All inputs share codec headers, size, pixel format, frame rate and audio layout; stream copying.")
+                    if self._concat_demux(video_paths, output_path):
+                        logger.info("Videos concatenated (stream copy) and saved to: %s", output_path)
+                        return True
+                    logger.warning("FFmpeg stream copy concatenation failed. Falling back to re-encoding.")
+            
+            # With NVENC, inputs that already share size, rotation and frame rate are joined and encoded
+            # in one ffmpeg pass (the concat demuxer applies the first input's rotation to all of them)
+            if self._uses_nvenc(quality_preset):
+                infos = self._batch_probe(video_paths)
+                if (all(infos)
+                        and len({(info.size, info.rotation) for info in infos}) == 1
+                        and len({round(info.fps, 2) for info in infos}) == 1):
+                    codec_args = self.get_encoding_params_as_cli(quality_preset=quality_preset, include_audio=True)
+                    if self._concat_demux(video_paths, output_path, codec_args):
+                        logger.info("FFmpeg NVENC concatenation successful for: %s", output_path)
+                        return True
+                    logger.warning("FFmpeg NVENC concatenation failed. Falling back to MoviePy method.")
 
             # Load all video clips with memory optimization
             clips = []
-            main_clip = None
-            target_size = None
-            
-            for i, path in enumerate(video_paths):
-                print(f"Loading video {i+1}: {path}")
-                clip = VideoFileClip(path)
+            for i, (path, clip) in enumerate(zip(video_paths, self._open_clips(video_paths))):
+                logger.debug("Loaded video %s: %s", i+1, path)
                 
                 # Check for high resolution and warn
                 width, height = clip.size
                 total_pixels = width * height
                 if total_pixels > 2073600:  # > 1920x1080
-                    print(f"⚠️ High resolution video detected: {width}x{height} ({total_pixels:,} pixels)")
+                    logger.warning("High resolution video detected: %sx%s (%s pixels)", width, height, format(total_pixels, ','))
                     
                     # Optimize for memory if very high resolution
                     if total_pixels > 8294400:  # > 4K (3840x2160)
-                        print("🔧 Applying memory optimization for ultra-high resolution video")
-                        clip = self._optimize_video_for_processing(clip, max_dimension=2160)
+                        logger.debug("Applying memory optimization for ultra-high resolution video")
+                        if self._uses_nvenc(quality_preset):
+                            work_dir = work_dir or tempfile.mkdtemp(prefix='videoresizer_')
+                        clip = self._optimize_video_for_processing(clip, max_dimension=2160, work_dir=work_dir,
+                                                                   quality_preset=quality_preset)
                 
-                # Use first video as reference for standardization
-                if i == 0:
-                    main_clip = clip
-                    target_size = clip.size
-                    clips.append(clip)
-                    print(f"Main video - Size: {clip.size}, FPS: {clip.fps}, Duration: {clip.duration:.1f}s")
-                else:
-                    # Standardize subsequent videos to match main video
-                    print(f"CTA video - Original Size: {clip.size}, FPS: {clip.fps}, Duration: {clip.duration:.1f}s")
-                    
-                    # Resize CTA video to match main video dimensions efficiently
-                    if clip.size != target_size:
-                        print(f"🔄 Resizing CTA video from {clip.size} to {target_size}")
-                        # Use a more memory-efficient resize method
-                        clip = clip.resize(newsize=target_size)
-                        print(f"✅ CTA video resized successfully")
-                    
-                    # Standardize frame rate to match main video
-                    if abs(clip.fps - main_clip.fps) > 0.1:  # Small tolerance for FPS differences
-                        print(f"🔄 Adjusting CTA video FPS from {clip.fps} to {main_clip.fps}")
-                        clip = clip.set_fps(main_clip.fps)
-                        print(f"✅ CTA video FPS adjusted successfully")
-                    
-                    clips.append(clip)
-                    print(f"CTA video standardized - Size: {clip.size}, FPS: {clip.fps}")
+                clips.append(clip)
             
-            # Concatenate clips with method='compose' for better compatibility
-            print("🔗 Concatenating standardized clips...")
-            try:
-                final_clip = concatenate_videoclips(clips, method="compose")
-                print("✅ Clips concatenated successfully")
-            except Exception as concat_error:
-                print(f"❌ Error during concatenation: {concat_error}")
-                # Try fallback method
-                print("🔄 Trying fallback concatenation method...")
-                final_clip = concatenate_videoclips(clips, method="chain")
-            
-            # Get encoding parameters
-            encoding_params = self.get_encoding_params(quality_preset)
-            
-            # Add specific parameters for better concatenation quality and memory efficiency
-            encoding_params.update({
+            final_clip = self._concatenate_clips(clips)
+            main_clip = clips[0]
+            
+            # Get encoding parameters with specific parameters for better concatenation quality and memory efficiency
+            encoding_params = self.get_encoding_params(quality_preset, custom_params={
                 'fps': main_clip.fps,  # Ensure consistent frame rate
                 'preset': 'medium',    # Balance between speed and quality
-                'threads': 4,          # Limit threads to prevent memory overload
+                'threads': 0,          # Let the encoder pick (libx264: one per core, scaled to frame height)
             })
             
-            print(f"💾 Writing final video with FPS: {main_clip.fps}")
+            logger.debug("Writing final video with FPS: %s", main_clip.fps)
             # Write output with quality settings
             final_clip.write_videofile(output_path, **encoding_params)
             
             # Clean up memory
-            print("🧹 Cleaning up memory...")
+            logger.debug("Cleaning up memory...")
             # Ensure final_clip is closed if it was created
             if 'final_clip' in locals() and final_clip:
                 final_clip.close()
@@ -473,18 +1196,85 @@ class VideoProcessor:
                 if clip_obj: # Check if clip_obj is not None
                     clip_obj.close()
             
-            print(f"✅ Videos concatenated and saved to: {output_path}")
+            logger.info("Videos concatenated and saved to: %s", output_path)
             return True
             
         except MemoryError:
-            print("❌ Memory error: Video resolution too high for available RAM")
-            print("💡 Try using a lower resolution CTA video or increase system memory")
+            logger.error("Memory error: Video resolution too high for available RAM")
+            logger.warning("Try using a lower resolution CTA video or increase system memory")
             return False
         except Exception as e:
-            print(f"❌ Error concatenating videos: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error concatenating videos: %s", e)
             return False
+        finally:
+            if work_dir:
+                shutil.rmtree(work_dir, ignore_errors=True)
+
+    @staticmethod
+    def _concatenate_clips(clips: List[Any]):
+        """
+        Concatenate in-memory clips, standardizing size and FPS to the first clip.
+        
+        Returns:
+            The concatenated clip
+        """
+        main_clip = clips[0]
+        target_size = main_clip.size
+        logger.debug("Main video - Size: %s, FPS: %s, Duration: %.1fs", main_clip.size, main_clip.fps, main_clip.duration)
+        standardized = [main_clip]
+        for clip in clips[1:]:
+            # Standardize subsequent videos to match main video
+            logger.debug("CTA video - Original Size: %s, FPS: %s, Duration: %.1fs", clip.size, clip.fps, clip.duration)
+            
+            # Resize CTA video to match main video dimensions efficiently
+            if clip.size != target_size:
+                logger.debug("Resizing CTA video from %s to %s", clip.size, target_size)
+                # Use a more memory-efficient resize method
+                clip = clip.resize(newsize=target_size)
+                logger.debug("CTA video resized successfully")
+            
+            # Standardize frame rate to match main video
+            if abs(clip.fps - main_clip.fps) > 0.1:  # Small tolerance for FPS differences
+                logger.debug("Adjusting CTA video FPS from %s to %s", clip.fps, main_clip.fps)
+                clip = clip.set_fps(main_clip.fps)
+                logger.debug("CTA video FPS adjusted successfully")
+            
+            standardized.append(clip)
+            logger.debug("CTA video standardized - Size: %s, FPS: %s", clip.size, clip.fps)
+        
+        # Clips were standardized to the same size above, so method='chain' just plays them in
+        # sequence; 'compose' would composite every frame onto a background
+        logger.debug("Concatenating standardized clips...")
+        from moviepy.editor import concatenate_videoclips
+        try:
+            final_clip = concatenate_videoclips(standardized, method="chain")
+            logger.debug("Clips concatenated successfully")
+        except Exception as concat_error:
+            logger.error("Error during concatenation: %s", concat_error)
+            # Try fallback method
+            logger.debug("Trying fallback concatenation method...")
+            final_clip = concatenate_videoclips(standardized, method="compose")
+        
+        return final_clip
+
+    @staticmethod
+    def _open_clips(video_paths: List[str]) -> List['VideoFileClip']:
+        """
+        Open several videos concurrently, preserving order.
+        
+        Opening a VideoFileClip is dominated by ffmpeg parsing the container, so the waits overlap.
+        If any file fails to open, the clips that did open are closed and the first error is raised.
+        """
+        from moviepy.editor import VideoFileClip
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(video_paths))) as executor:
+            futures = [executor.submit(VideoFileClip, path) for path in video_paths]
+        errors = [future.exception() for future in futures if future.exception() is not None]
+        if errors:
+            for future in futures:
+                if future.exception() is None:
+                    future.result().close()
+            raise errors[0]
+        return [future.result() for future in futures]
 
     def process_video_complete(self,
                              input_path: str,
@@ -500,7 +1290,8 @@ class VideoProcessor:
                              gradient_blend: float = 0.3,
                              quality_preset: Optional[str] = None,
                              watermark_path: Optional[str] = None,
-                             watermark_position: Optional[str] = None) -> bool:
+                             watermark_position: Optional[str] = None,
+                             stream_copy: bool = False) -> bool:
         """
         Complete video processing pipeline with improved CTA video handling and memory optimization.
         Now supports watermark overlay, blurred background with controllable blur strength and gradient bleeding effect.
@@ -520,203 +1311,247 @@ class VideoProcessor:
             quality_preset: Override quality preset ('lossless', 'high', 'medium', 'low')
             watermark_path: Optional path to watermark image
             watermark_position: Optional position for watermark overlay
+            stream_copy: If True and the only steps are time cropping and appending a CTA video with
+                         the same stream layout, join them without re-encoding. Much faster, but the
+                         cut starts at the keyframe at or before start_time.
         
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            print(f"=== COMPLETE VIDEO PROCESSING DEBUG ===")
-            print(f"Input path: {input_path}")
-            print(f"Output path: {output_path}")
-            print(f"CTA video path: {cta_video_path}")
-            print(f"Start time received: {start_time} (type: {type(start_time)})")
-            print(f"End time received: {end_time} (type: {type(end_time)})")
-            print(f"Target ratio: {target_ratio}")
-            print(f"Resize method: {resize_method}")
-            print(f"Blur background: {blur_background}")
-            print(f"Quality preset: {quality_preset or self.quality_preset}")
-            print(f"Time cropping enabled: {start_time is not None and end_time is not None}")
-            print(f"Watermark path: {watermark_path}")
-            print(f"Watermark position: {watermark_position}")
-            print(f"Blur strength: {blur_strength}")
-            print(f"Gradient blend: {gradient_blend}")
+            logger.debug("Complete video processing parameters:")
+            logger.debug("Input path: %s", input_path)
+            logger.debug("Output path: %s", output_path)
+            logger.debug("CTA video path: %s", cta_video_path)
+            logger.debug("Start time received: %s (type: %s)", start_time, type(start_time))
+            logger.debug("End time received: %s (type: %s)", end_time, type(end_time))
+            logger.debug("Target ratio: %s", target_ratio)
+            logger.debug("Resize method: %s", resize_method)
+            logger.debug("Blur background: %s", blur_background)
+            logger.debug("Quality preset: %s", quality_preset or self.quality_preset)
+            logger.debug("Time cropping enabled: %s", start_time is not None and end_time is not None)
+            logger.debug("Watermark path: %s", watermark_path)
+            logger.debug("Watermark position: %s", watermark_position)
+            logger.debug("Blur strength: %s", blur_strength)
+            logger.debug("Gradient blend: %s", gradient_blend)
             
             # Check video resolutions early for memory planning
             if cta_video_path:
-                cta_info = self.get_video_info(cta_video_path)
+                # Probe both inputs at once; later steps reuse the cached results
+                _, cta_info = self._batch_probe([input_path, cta_video_path])
                 if cta_info:
-                    width, height = cta_info['size']
+                    width, height = cta_info.display_size
                     total_pixels = width * height
-                    print(f"📊 CTA video resolution: {width}x{height} ({total_pixels:,} pixels)")
+                    logger.debug("CTA video resolution: %sx%s (%s pixels)", width, height, format(total_pixels, ','))
                     if total_pixels > 8294400:  # > 4K
-                        print("⚠️ WARNING: Ultra-high resolution CTA video detected!")
-                        print("💡 This may cause memory issues. Consider using a lower resolution CTA video.")
-            
-            print(f"========================================")
-            
-            with tempfile.TemporaryDirectory() as temp_dir:
-                current_file = input_path
-                processed_cta_path = cta_video_path
+                        logger.warning("Ultra-high resolution CTA video detected")
+                        logger.warning("This may cause memory issues. Consider using a lower resolution CTA video.")
+            
+            
+            # Keep intermediates next to the output so the final result is renamed, not copied
+            output_dir = os.path.dirname(os.path.abspath(output_path))
+            os.makedirs(output_dir, exist_ok=True)
+            with tempfile.TemporaryDirectory(dir=output_dir) as temp_dir:
+                # Run every requested step in one ffmpeg filter graph when they can all be expressed
+                # as ffmpeg filters (the blurred background is MoviePy-only), so frames are decoded
+                # and encoded once instead of once per step
+                has_watermark = bool(watermark_path and os.path.exists(watermark_path))
+                has_steps = (start_time is not None and end_time is not None) or target_ratio is not None \
+                    or bool(cta_video_path) or has_watermark
+                # Trim + CTA alone: the concat demuxer trims the main video itself (inpoint/outpoint),
+                # so when both files share a stream layout nothing is decoded or encoded
+                if stream_copy and start_time is not None and end_time is not None and cta_video_path \
+                        and os.path.exists(cta_video_path) and target_ratio is None and not has_watermark:
+                    main_signature, cta_signature = _run_concurrently(self._stream_signature,
+                                                                      [input_path, cta_video_path])
+                    if main_signature and main_signature == cta_signature:
+                        logger.info("Trimming and appending the CTA video with stream copy")
+                        temp_joined = os.path.join(temp_dir, f"temp_joined{os.path.splitext(output_path)[1] or '.mp4'}")
+                        if self._concat_demux([input_path, cta_video_path], temp_joined,
+                                              trims=[(max(start_time, 0), end_time), None]):
+                            _move_into_place(temp_joined, output_path)
+                            logger.info("Complete video processing finished. Output saved to: %s", output_path)
+                            return True
+                        logger.warning("Stream copy trim + concat failed. Re-encoding instead.")
                 
-                # Determine if we are using intermediate lossless mkv files
-                use_intermediate_mkv = (quality_preset or self.quality_preset) == 'lossless'
-
-                # Step 1: Time cropping if specified
-                if start_time is not None and end_time is not None:
-                    print(f"📽️ STEP 1: Time cropping from {start_time}s to {end_time}s")
-                    temp_cropped_ext = ".mkv" if use_intermediate_mkv else ".mp4"
-                    temp_cropped = os.path.join(temp_dir, f"temp_cropped{temp_cropped_ext}")
-                    if not self.crop_video_by_time(current_file, temp_cropped, start_time, end_time, quality_preset, is_intermediate_for_concat=use_intermediate_mkv):
-                        return False
-                    current_file = temp_cropped
-                else:
-                    print(f"⏭️ STEP 1: Skipping time cropping (start_time={start_time}, end_time={end_time})")
-
-                # Step 2: Aspect ratio change if specified
-                if target_ratio is not None:
-                    print(f"📐 STEP 2: Changing aspect ratio to {target_ratio[0]}:{target_ratio[1]} using {resize_method}")
-                    if blur_background and resize_method == 'pad':
-                        print(f"🌫️ Using blurred background for letterboxing")
+                if has_steps and not (blur_background and resize_method == 'pad'):
+                    logger.info("Running all steps in a single FFmpeg pass")
+                    temp_fused = os.path.join(temp_dir, f"temp_fused{os.path.splitext(output_path)[1] or '.mp4'}")
+                    if self._process_video_complete_ffmpeg(input_path, temp_fused, cta_video_path, start_time, end_time,
+                                                           target_ratio, resize_method, pad_color, quality_preset,
+                                                           watermark_path if has_watermark else None, watermark_position):
+                        _move_into_place(temp_fused, output_path)
+                        logger.info("Complete video processing finished. Output saved to: %s", output_path)
+                        return True
+                    logger.warning("Single-pass FFmpeg processing failed, falling back to MoviePy processing")
+                elif target_ratio is not None and not cta_video_path and not has_watermark:
+                    # The blurred background has its own single-pass ffmpeg graph (trim included)
+                    logger.info("Running time crop and blurred background in a single FFmpeg pass")
+                    temp_blurred = os.path.join(temp_dir, f"temp_blurred{os.path.splitext(output_path)[1] or '.mp4'}")
+                    if self._pad_to_ratio_blur_ffmpeg(input_path, temp_blurred, target_ratio, blur_strength, gradient_blend,
+                                                      quality_preset, start_time, end_time):
+                        _move_into_place(temp_blurred, output_path)
+                        logger.info("Complete video processing finished. Output saved to: %s", output_path)
+                        return True
+                    logger.warning("FFmpeg blur background failed, falling back to MoviePy processing")
+                
+                if not has_steps:
+                    # Nothing to do; never move the caller's input
+                    if os.path.abspath(input_path) != os.path.abspath(output_path):
+                        shutil.copy2(input_path, output_path)
+                    logger.info("Complete video processing finished. Output saved to: %s", output_path)
+                    return True
+                
+                # Chain the steps on in-memory MoviePy clips so the video is decoded once and
+                # encoded once, instead of once per step through temp files
+                opened_clips = []
+                clip = None
+                temp_output = os.path.join(temp_dir, f"temp_output{os.path.splitext(output_path)[1] or '.mp4'}")
+                try:
+                    from moviepy.editor import VideoFileClip
+                    clip = VideoFileClip(input_path)
+                    opened_clips.append(clip)
                     
-                    temp_resized_ext = ".mkv" if use_intermediate_mkv else ".mp4"
-                    temp_resized = os.path.join(temp_dir, f"temp_resized{temp_resized_ext}")
-                    if not self.resize_aspect_ratio(current_file, temp_resized, target_ratio, resize_method, pad_color, blur_background, blur_strength, gradient_blend, quality_preset, is_intermediate_for_concat=use_intermediate_mkv):
-                        return False
-                    current_file = temp_resized
-
-                    # Also resize CTA video to match if it exists
-                    if processed_cta_path and os.path.exists(processed_cta_path):
-                        print(f"📐 STEP 2b: Resizing CTA video to match aspect ratio {target_ratio[0]}:{target_ratio[1]}")
-                        temp_cta_resized_ext = ".mkv" if use_intermediate_mkv else ".mp4"
-                        temp_cta_resized = os.path.join(temp_dir, f"temp_cta_resized{temp_cta_resized_ext}")
-                        try:
-                            cta_resize_quality = 'high' # Always use 'high' for CTA intermediate resizing for speed
-                            if use_intermediate_mkv: # but if main is lossless, output CTA intermediate as mkv too
-                                print(f"ℹ️ Using '{cta_resize_quality}' quality for CTA video resizing (main preset: {quality_preset}), outputting as .mkv intermediate.")
-                            else:
-                                print(f"ℹ️ Using '{cta_resize_quality}' quality for CTA video resizing (main preset: {quality_preset}).")
-
-                            if self.resize_aspect_ratio(processed_cta_path, temp_cta_resized, target_ratio, resize_method, pad_color, blur_background, blur_strength, gradient_blend, cta_resize_quality, is_intermediate_for_concat=use_intermediate_mkv):
-                                processed_cta_path = temp_cta_resized
-                                print("✅ CTA video successfully resized")
-                            else:
-                                print("⚠️ Warning: Could not resize CTA video, will attempt standardization during concatenation")
-                        except MemoryError:
-                            print("❌ Memory error during CTA video resize - CTA video resolution too high")
-                            print("💡 Skipping CTA video due to memory constraints")
-                            processed_cta_path = None
-                else:
-                    print(f"⏭️ STEP 2: Skipping aspect ratio change")
-
-                # Step 3: Append CTA video if specified
-                if processed_cta_path and os.path.exists(processed_cta_path):
-                    print(f"🎯 STEP 3: Appending CTA video")
-                    print(f"Main video: {current_file}")
-                    print(f"CTA video: {processed_cta_path}")
-
-                    main_info = self.get_video_info(current_file)
-                    cta_info = self.get_video_info(processed_cta_path)
-
-                    if main_info and cta_info:
-                        print(f"Main video info: {main_info['size']} @ {main_info['fps']:.1f}fps, Duration: {main_info.get('duration', 'N/A')}s")
-                        print(f"CTA video info: {cta_info['size']} @ {cta_info['fps']:.1f}fps, Duration: {cta_info.get('duration', 'N/A')}s")
+                    # Step 1: Time cropping if specified
+                    if start_time is not None and end_time is not None:
+                        logger.info("STEP 1: Time cropping from %ss to %ss", start_time, end_time)
+                        clip = self._crop_by_time_clip(clip, start_time, end_time)
+                    else:
+                        logger.debug("STEP 1: Skipping time cropping (start_time=%s, end_time=%s)", start_time, end_time)
+                    
+                    # Step 2: Aspect ratio change if specified
+                    if target_ratio is not None:
+                        logger.info("STEP 2: Changing aspect ratio to %s:%s using %s", target_ratio[0], target_ratio[1], resize_method)
+                        if blur_background and resize_method == 'pad':
+                            logger.debug("Using blurred background for letterboxing")
+                        clip = self.resize_clip(clip, target_ratio, resize_method, pad_color,
+                                                              blur_background, blur_strength, gradient_blend)
+                    else:
+                        logger.debug("STEP 2: Skipping aspect ratio change")
                     
-                    temp_concat_ext = ".mkv" if use_intermediate_mkv else ".mp4" # Output of concat should also be mkv if inputs were
-                    temp_concatenated = os.path.join(temp_dir, f"temp_concatenated{temp_concat_ext}")
+                    # Step 3: Append CTA video if specified (given the same aspect ratio treatment first)
+                    if cta_video_path and os.path.exists(cta_video_path):
+                        logger.info("STEP 3: Appending CTA video")
+                        cta_clip = VideoFileClip(cta_video_path)
+                        opened_clips.append(cta_clip)
+                        if target_ratio is not None:
+                            logger.info("STEP 3b: Resizing CTA video to match aspect ratio %s:%s", target_ratio[0], target_ratio[1])
+                            cta_clip = self.resize_clip(cta_clip, target_ratio, resize_method, pad_color,
+                                                                      blur_background, blur_strength, gradient_blend)
+                        clip = self._concatenate_clips([clip, cta_clip])
+                        logger.info("CTA video successfully appended")
+                    else:
+                        logger.debug("STEP 3: No CTA video to append")
                     
-                    try:
-                        if not self.concatenate_videos([current_file, processed_cta_path], temp_concatenated, quality_preset):
-                            print("❌ Failed to concatenate videos")
-                            return False
-                        print("✅ CTA video successfully appended")
-                        current_file = temp_concatenated
-                    except MemoryError:
-                        print("❌ Memory error during concatenation - videos too large for available RAM")
-                        print("💡 Try using lower resolution videos or increase system memory")
-                        return False
-                else:
-                    print(f"⏭️ STEP 3: No CTA video to append")
-
-                # Step 4: After all processing steps, overlay watermark if provided
-                # The output_path (final destination) is usually .mp4
-                # If current_file is .mkv (from lossless concat) and watermark is applied, add_watermark will re-encode to .mp4
-                if watermark_path and os.path.exists(watermark_path):
-                    print(f"🖼️ Adding watermark: {watermark_path} at {watermark_position}")
-                    # Ensure temp_watermarked uses the final output_path's extension (typically .mp4)
-                    # or a specific temp .mp4 if output_path is not .mp4 for some reason.
-                    # For now, assume output_path from Flask app is .mp4, so add_watermark writes to a temp .mp4
-                    temp_watermarked = os.path.join(temp_dir, f"temp_watermarked{os.path.splitext(output_path)[1] or '.mp4'}")
+                    # Step 4: Overlay watermark if provided
+                    if has_watermark:
+                        logger.debug("Adding watermark: %s at %s", watermark_path, watermark_position)
+                        clip = self._watermark_clip(clip, watermark_path, watermark_position)
                     
-                    # Watermarking re-encodes, so it doesn't need is_intermediate_for_concat.
-                    # It should use the final quality_preset.
-                    if not self.add_watermark(current_file, temp_watermarked, watermark_path, watermark_position, quality_preset_override=quality_preset):
-                        print("❌ Failed to add watermark")
-                        return False
-                    current_file = temp_watermarked
-
-                # Final step: Ensure current_file is moved to output_path with the correct container
-                # If current_file is .mkv (from lossless direct concat without watermark) and output_path is .mp4, convert.
-                final_output_is_mp4 = output_path.lower().endswith('.mp4')
-                current_file_is_mkv = current_file.lower().endswith('.mkv')
-
-                if current_file_is_mkv and final_output_is_mp4 and current_file != output_path:
-                    if (quality_preset or self.quality_preset) == 'lossless':
-                        logging.info(f"Lossless MKV to MP4 conversion needed for final output: {current_file} -> {output_path}")
-                        try:
-                            # Attempt direct stream copy if codecs are compatible (H.264 in MKV to H.264 in MP4)
-                            # PCM audio in MKV needs re-encoding to AAC for MP4
-                            ffmpeg_cmd = [
-                                'ffmpeg', '-y', '-i', current_file,
-                                '-c:v', 'copy', # Copy video stream
-                                '-c:a', 'aac', '-b:a', '320k', # Re-encode audio to AAC for MP4 compatibility
-                                '-movflags', '+faststart',
-                                output_path
-                            ]
-                            logging.info(f"Executing FFmpeg for MKV to MP4 (lossless video, AAC audio): {' '.join(ffmpeg_cmd)}")
-                            process = subprocess.Popen(ffmpeg_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                            stdout, stderr = process.communicate()
-                            if process.returncode != 0:
-                                logging.error(f"FFmpeg MKV to MP4 conversion failed (video copy, audio AAC). StdErr: {stderr.decode(errors='ignore')}")
-                                logging.info("Falling back to MoviePy re-encode for MKV to MP4 (lossless).")
-                                clip = VideoFileClip(current_file)
-                                clip.write_videofile(output_path, **self.get_encoding_params(quality_preset='lossless'))
-                                clip.close()
-                            else:
-                                logging.info("FFmpeg MKV to MP4 conversion (video copy, audio AAC) successful.")
-                        except Exception as e_conv:
-                            logging.error(f"Error during MKV to MP4 conversion for {current_file}: {e_conv}. Falling back to MoviePy re-encode.")
-                            traceback.print_exc()
-                            clip = VideoFileClip(current_file)
-                            clip.write_videofile(output_path, **self.get_encoding_params(quality_preset='lossless')) # Full lossless re-encode
-                            clip.close()
-                    else: # Should not happen if current_file_is_mkv was due to lossless path
-                        logging.info(f"Copying non-lossless MKV {current_file} to MP4 {output_path} (may involve re-encode by MoviePy if add_watermark wasn't called)")
-                        # This scenario is less likely if .mkv is only for lossless intermediates.
-                        # If it occurs, just use MoviePy to handle it.
-                        clip = VideoFileClip(current_file)
-                        clip.write_videofile(output_path, **self.get_encoding_params(quality_preset=(quality_preset or self.quality_preset)))
-                        clip.close()
-                elif current_file != output_path:
-                    import shutil
-                    shutil.copy2(current_file, output_path)
+                    logger.debug("Writing final video: %s", output_path)
+                    clip.write_videofile(temp_output, **self.get_encoding_params(quality_preset=quality_preset))
+                finally:
+                    for clip_obj in [clip, *opened_clips]:
+                        if clip_obj is not None:
+                            clip_obj.close()
                 
-                print(f"✅ Complete video processing finished. Output saved to: {output_path}")
-                print(f"🎉 PROCESS_VIDEO_COMPLETE RETURNING TRUE - SUCCESS!")
+                _move_into_place(temp_output, output_path)
+                
+                logger.info("Complete video processing finished. Output saved to: %s", output_path)
                 return True
                 
         except MemoryError:
-            print("❌ Memory error: Videos too large for available RAM")
-            print("💡 Try using lower resolution videos or increase system memory")
-            print(f"🔴 PROCESS_VIDEO_COMPLETE RETURNING FALSE - MEMORY ERROR!")
+            logger.error("Memory error: Videos too large for available RAM")
+            logger.warning("Try using lower resolution videos or increase system memory")
             return False
         except Exception as e:
-            print(f"❌ Error in complete video processing: {str(e)}")
-            print(f"🔍 Exception type: {type(e).__name__}")
-            import traceback
-            traceback.print_exc()
-            print(f"🔴 PROCESS_VIDEO_COMPLETE RETURNING FALSE - EXCEPTION!")
+            logger.exception("Error in complete video processing: %s", e)
             return False
     
+    def _process_video_complete_ffmpeg(self,
+                                       input_path: str,
+                                       output_path: str,
+                                       cta_video_path: Optional[str],
+                                       start_time: Optional[float],
+                                       end_time: Optional[float],
+                                       target_ratio: Optional[Tuple[int, int]],
+                                       resize_method: Literal['crop', 'pad', 'stretch'],
+                                       pad_color: Tuple[int, int, int],
+                                       quality_preset: Optional[str],
+                                       watermark_path: Optional[str],
+                                       watermark_position: Optional[str]) -> bool:
+        """
+        Time crop, aspect ratio change, CTA append and watermark in a single ffmpeg command.
+        
+        The CTA video gets the same aspect ratio treatment and is then scaled and retimed to
+        match the main video; a silent track stands in for a missing audio stream.
+        
+        Returns:
+            bool: True if successful, False otherwise (the caller falls back to the stepwise pipeline)
+        """
+        main_info = self._probe_video_info(input_path)
+        cta_info = self._probe_video_info(cta_video_path) if cta_video_path else None
+        if main_info is None or (cta_video_path and cta_info is None):
+            return False
+        
+        inputs = self._hwaccel_input_args(input_path, quality_preset)
+        duration = main_info.duration
+        if start_time is not None and end_time is not None:
+            start = max(start_time, 0)
+            end = min(end_time, main_info.duration) if main_info.duration > 0 else end_time
+            if start >= end:
+                return False
+            inputs += ['-ss', str(start), '-to', str(end)]
+            duration = end - start
+        inputs += ['-i', input_path]
+        next_input = 1
+        
+        # ffmpeg auto-rotates frames before they reach the filter graph, so all geometry is
+        # computed from the displayed size
+        main_filter, (out_width, out_height) = (
+            self._ratio_filter(*main_info.display_size, target_ratio, resize_method, pad_color)
+            if target_ratio else (None, main_info.display_size))
+        filters = [f"[0:v]{main_filter or 'null'},setsar=1[v0]"]
+        video_label = '[v0]'
+        audio_label = '0:a:0' if main_info.has_audio else None
+        
+        if cta_info:
+            cta_index = next_input
+            inputs += ['-i', cta_video_path]
+            next_input += 1
+            cta_filter = (self._ratio_filter(*cta_info.display_size, target_ratio, resize_method, pad_color)[0]
+                          if target_ratio else None)
+            cta_chain = [f for f in (cta_filter, f"scale={out_width}:{out_height}", f"fps={main_info.fps}", "setsar=1") if f]
+            filters.append(f"[{cta_index}:v]{','.join(cta_chain)}[v1]")
+            if main_info.has_audio or cta_info.has_audio:
+                segment_audio = []
+                for info, index, segment_duration in ((main_info, 0, duration), (cta_info, cta_index, cta_info.duration)):
+                    if info.has_audio:
+                        segment_audio.append(f"[{index}:a:0]")
+                    else:
+                        inputs += ['-f', 'lavfi', '-t', str(segment_duration),
+                                   '-i', 'anullsrc=channel_layout=stereo:sample_rate=44100']
+                        segment_audio.append(f"[{next_input}:a]")
+                        next_input += 1
+                filters.append(f"[v0]{segment_audio[0]}[v1]{segment_audio[1]}concat=n=2:v=1:a=1[vc][ac]")
+                audio_label = '[ac]'
+            else:
+                filters.append("[v0][v1]concat=n=2:v=1:a=0[vc]")
+            video_label = '[vc]'
+        
+        if watermark_path:
+            inputs += ['-i', watermark_path]
+            overlay_position = _WATERMARK_OVERLAY_POSITIONS.get(watermark_position, _WATERMARK_OVERLAY_POSITIONS['top-left'])
+            filters.append(f"[{next_input}:v]scale=-1:{int(out_height * 0.15)}[wm];"
+                           f"{video_label}[wm]overlay={overlay_position}[vw]")
+            video_label = '[vw]'
+        
+        command = ['ffmpeg', '-y', *inputs, '-filter_complex', ';'.join(filters), '-map', video_label]
+        if audio_label:
+            command += ['-map', audio_label]
+        command += [*self.get_encoding_params_as_cli(quality_preset=quality_preset, include_audio=True), output_path]
+        return self._run_ffmpeg(command, "single-pass processing")
+
     def generate_aspect_ratio_preview(self,
                                     input_path: str,
                                     output_path: str,
@@ -745,52 +1580,60 @@ class VideoProcessor:
             bool: True if successful, False otherwise
         """
         try:
-            from moviepy.editor import VideoFileClip
-            import os
+            from moviepy.editor import ImageClip, VideoFileClip
             
-            print(f"🖼️ Generating aspect ratio preview...")
-            print(f"📁 Input: {input_path}")
-            print(f"📐 Target ratio: {target_ratio[0]}:{target_ratio[1]}")
-            print(f"🔧 Method: {resize_method}")
-            print(f"🌫️ Blur background: {blur_background}")
+            logger.info("Generating aspect ratio preview...")
+            logger.debug("Input: %s", input_path)
+            logger.debug("Target ratio: %s:%s", target_ratio[0], target_ratio[1])
+            logger.debug("Method: %s", resize_method)
+            logger.debug("Blur background: %s", blur_background)
             if blur_background:
-                print(f"💫 Blur strength: {blur_strength}, Gradient blend: {gradient_blend}")
+                logger.debug("Blur strength: %s, Gradient blend: %s", blur_strength, gradient_blend)
             
             # Validate input file
             if not self._validate_input(input_path):
                 return False
             
-            # Load video
-            clip = VideoFileClip(input_path)
-            
-            # Determine frame time
-            if frame_time is None:
-                # Use middle of video for preview
-                frame_time = clip.duration / 2
-                print(f"⏰ Using middle frame at {frame_time:.1f}s")
+            # Only one frame is needed, so let ffmpeg seek and decode it instead of opening a MoviePy clip
+            clip = None
+            info = self._probe_video_info(input_path)
+            frame = None
+            if info is not None:
+                frame_time = self._preview_frame_time(frame_time, info.duration)
+                frame = self._extract_frame_ffmpeg(input_path, frame_time, info.width, info.height)
+            frame_clip = None
+            if frame is not None:
+                original_height, original_width = frame.shape[:2]
             else:
-                # Clamp frame_time to valid range
-                frame_time = max(0, min(frame_time, clip.duration))
-                print(f"⏰ Using specified frame at {frame_time:.1f}s")
-            
-            # Extract single frame as ImageClip
-            frame_clip = clip.subclip(frame_time, frame_time + 0.1).to_ImageClip(duration=1)
-            original_width, original_height = frame_clip.size
+                logger.warning("FFmpeg frame extraction failed, falling back to MoviePy")
+                clip = VideoFileClip(input_path)
+                frame_time = self._preview_frame_time(frame_time, clip.duration)
+                # Extract single frame as ImageClip
+                frame_clip = clip.subclip(frame_time, frame_time + 0.1).to_ImageClip(duration=1)
+                original_width, original_height = frame_clip.size
             original_ratio = original_width / original_height
             target_ratio_decimal = target_ratio[0] / target_ratio[1]
             
-            print(f"📏 Original dimensions: {original_width}x{original_height}")
-            print(f"📊 Original ratio: {original_ratio:.2f}, Target ratio: {target_ratio_decimal:.2f}")
+            logger.debug("Original dimensions: %sx%s", original_width, original_height)
+            logger.debug("Original ratio: %.2f, Target ratio: %.2f", original_ratio, target_ratio_decimal)
             
             # Process frame based on resize method (reuse existing logic)
+            processed_frame = None
+            preview_image = None
+            if resize_method in ('pad', 'stretch') and frame_clip is None:
+                frame_clip = ImageClip(frame, duration=1)
             if resize_method == 'crop':
-                print(f"✂️ Applying crop preview...")
-                processed_frame = self._crop_to_ratio(frame_clip, target_ratio)
+                logger.debug("Applying crop preview...")
+                if frame is not None:
+                    # A crop of the decoded frame is just a slice; no MoviePy clip needed
+                    preview_image = self._crop_ndarray(frame, target_ratio)
+                else:
+                    processed_frame = self._crop_to_ratio(frame_clip, target_ratio)
             elif resize_method == 'pad':
-                print(f"📦 Applying pad preview...")
+                logger.debug("Applying pad preview...")
                 processed_frame = self._pad_to_ratio(frame_clip, target_ratio, pad_color, blur_background, blur_strength, gradient_blend)
             elif resize_method == 'stretch':
-                print(f"↔️ Applying stretch preview...")
+                logger.debug("Applying stretch preview...")
                 processed_frame = self._stretch_to_ratio(frame_clip, target_ratio)
             else:
                 raise ValueError(f"Unsupported resize method: {resize_method}")
@@ -799,31 +1642,100 @@ class VideoProcessor:
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
             
             # Save the preview image
-            print(f"💾 Saving preview to: {output_path}")
+            logger.debug("Saving preview to: %s", output_path)
             
-            # Handle image format based on file extension
-            _, ext = os.path.splitext(output_path)
-            if ext.lower() in ['.jpg', '.jpeg']:
-                # Convert RGBA to RGB for JPEG compatibility
-                processed_frame.save_frame(output_path, t=0, logger=None)
-            else:
-                # PNG supports RGBA, save directly
-                processed_frame.save_frame(output_path, t=0)
+            # Render the frame once and encode it directly instead of going through save_frame
+            if preview_image is None:
+                preview_image = processed_frame.get_frame(0)
+            self._write_preview_image(output_path, preview_image)
             
             # Clean up
-            clip.close()
-            frame_clip.close()
-            processed_frame.close()
+            for clip_obj in (clip, frame_clip, processed_frame):
+                if clip_obj is not None:
+                    clip_obj.close()
             
-            print(f"✅ Preview generated successfully!")
+            logger.info("Preview generated successfully!")
             return True
             
         except Exception as e:
-            print(f"❌ Error generating preview: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error generating preview: %s", e)
             return False
 
+    @staticmethod
+    def _write_preview_image(output_path: str, frame: np.ndarray) -> None:
+        """
+        Encode an RGB frame to output_path, choosing the format from its extension.
+        
+        JPEG goes through simplejpeg (libjpeg-turbo) when installed, everything else through
+        cv2.imwrite; PNG uses a low zlib level, trading a little size for much faster writes.
+        """
+        if frame.dtype != np.uint8:
+            frame = np.clip(frame, 0, 255).astype(np.uint8)
+        frame = np.ascontiguousarray(frame[:, :, :3])
+        _, ext = os.path.splitext(output_path)
+        if ext.lower() in ('.jpg', '.jpeg'):
+            try:
+                import simplejpeg
+            except ImportError:
+                simplejpeg = None
+            if simplejpeg is not None:
+                with open(output_path, 'wb') as f:
+                    f.write(simplejpeg.encode_jpeg(frame, quality=90, colorspace='RGB', fastdct=True))
+                return
+            params = [cv2.IMWRITE_JPEG_QUALITY, 90]
+        elif ext.lower() == '.png':
+            params = [cv2.IMWRITE_PNG_COMPRESSION, 3]
+        else:
+            params = []
+        if not cv2.imwrite(output_path, cv2.cvtColor(frame, cv2.COLOR_RGB2BGR), params):
+            raise IOError(f"Could not write preview image to {output_path}")
+
+    @staticmethod
+    def _preview_frame_time(frame_time: Optional[float], duration: float) -> float:
+        """Middle of the video when frame_time is None, otherwise frame_time clamped to the video."""
+        if frame_time is None:
+            # Use middle of video for preview
+            frame_time = duration / 2
+            logger.debug("Using middle frame at %.1fs", frame_time)
+        else:
+            # Clamp frame_time to valid range
+            frame_time = max(0, min(frame_time, duration))
+            logger.debug("Using specified frame at %.1fs", frame_time)
+        return frame_time
+
+    @staticmethod
+    def _extract_frame_ffmpeg(file_path: str, t: float, width: int, height: int) -> Optional[np.ndarray]:
+        """
+        Decode the single frame at time t with ffmpeg (input seek, so only one GOP is decoded).
+        
+        Args:
+            file_path: Video to read
+            t: Time in seconds
+            width, height: Probed frame size, used to shape the raw RGB bytes
+        
+        Returns:
+            uint8 array of shape (height, width, 3), or None if ffmpeg fails
+        """
+        command = [
+            'ffmpeg', '-v', 'error', '-ss', f"{t:.3f}", '-i', file_path,
+            '-frames:v', '1', '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-'
+        ]
+        try:
+            result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        except OSError as e:
+            logger.error("Could not run ffmpeg to extract a frame: %s", e)
+            return None
+        if result.returncode != 0 or not result.stdout:
+            logger.error("FFmpeg frame extraction failed. StdErr: %s", result.stderr.decode(errors='ignore'))
+            return None
+        frame = np.frombuffer(result.stdout, dtype=np.uint8)
+        # ffmpeg applies the rotation tag, so portrait phone videos come out with the probed size swapped
+        for shape in ((height, width, 3), (width, height, 3)):
+            if frame.size == shape[0] * shape[1] * 3:
+                return frame.reshape(shape)
+        logger.error("Extracted frame has %d bytes, expected %dx%d RGB", frame.size, width, height)
+        return None
+
     def _crop_to_ratio(self, clip, target_ratio: Tuple[int, int]):
         """Crop video to target aspect ratio."""
         width, height = clip.size
@@ -845,6 +1757,20 @@ class VideoProcessor:
             y2 = y_center + new_height // 2
             return clip.crop(y1=y1, y2=y2)
     
+    @staticmethod
+    def _crop_ndarray(arr: np.ndarray, target_ratio: Tuple[int, int]) -> np.ndarray:
+        """Crop a single frame to target aspect ratio (same window as _crop_to_ratio); returns a view."""
+        height, width = arr.shape[:2]
+        target_ratio_decimal = target_ratio[0] / target_ratio[1]
+        
+        if width / height > target_ratio_decimal:
+            # Frame is wider than target, crop width
+            new_width = int(height * target_ratio_decimal)
+            return arr[:, width // 2 - new_width // 2:width // 2 + new_width // 2]
+        # Frame is taller than target, crop height
+        new_height = int(width / target_ratio_decimal)
+        return arr[height // 2 - new_height // 2:height // 2 + new_height // 2]
+    
     def _pad_to_ratio(self, clip, target_ratio: Tuple[int, int], pad_color: Tuple[int, int, int], blur_background: bool, blur_strength: int = 25, gradient_blend: float = 0.3):
         """Add padding to video to achieve target aspect ratio."""
         from moviepy.editor import ColorClip, CompositeVideoClip
@@ -855,11 +1781,11 @@ class VideoProcessor:
         
         # Check if aspect ratios are already very close (within 0.01 tolerance)
         if abs(current_ratio - target_ratio_decimal) < 0.01:
-            print(f"ℹ️ Aspect ratios already match (current: {current_ratio:.2f}, target: {target_ratio_decimal:.2f})")
+            logger.debug("Aspect ratios already match (current: %.2f, target: %.2f)", current_ratio, target_ratio_decimal)
             if blur_background:
-                print(f"🌫️ Blur background requested but no padding needed - aspect ratios are already the same!")
-                print(f"💡 Tip: Try converting to a different aspect ratio to see the blur effect (e.g., 9:16 for portrait)")
-            print(f"✅ Returning original video without changes")
+                logger.debug("Blur background requested but no padding needed - aspect ratios are already the same")
+                logger.info("Tip: Try converting to a different aspect ratio to see the blur effect (e.g., 9:16 for portrait)")
+            logger.debug("Returning original video without changes")
             return clip
         
         if current_ratio > target_ratio_decimal:
@@ -869,10 +1795,12 @@ class VideoProcessor:
             if new_height % 2 != 0:
                 new_height += 1
             pad_height = (new_height - height) // 2
-            print(f"📐 Adding top/bottom padding: {pad_height}px each side (final size: {width}x{new_height})")
+            logger.debug("Adding top/bottom padding: %spx each side (final size: %sx%s)", pad_height, width, new_height)
             if blur_background:
-                print(f"🌫️ Creating blurred background for letterboxing (blur: {blur_strength}, gradient: {gradient_blend})")
-                background = self._create_blurred_background(clip, (width, new_height), blur_strength, gradient_blend)
+                logger.debug("Creating blurred background for letterboxing (blur: %s, gradient: %s)", blur_strength, gradient_blend)
+                # Background and video are produced together in one per-frame pass
+                return self._create_blurred_background(clip, (width, new_height), blur_strength, gradient_blend,
+                                                       composite_foreground=True)
             else:
                 background = ColorClip(
                     size=(width, new_height),
@@ -887,10 +1815,12 @@ class VideoProcessor:
             if new_width % 2 != 0:
                 new_width += 1
             pad_width = (new_width - width) // 2
-            print(f"📐 Adding left/right padding: {pad_width}px each side (final size: {new_width}x{height})")
+            logger.debug("Adding left/right padding: %spx each side (final size: %sx%s)", pad_width, new_width, height)
             if blur_background:
-                print(f"🌫️ Creating blurred background for pillarboxing (blur: {blur_strength}, gradient: {gradient_blend})")
-                background = self._create_blurred_background(clip, (new_width, height), blur_strength, gradient_blend)
+                logger.debug("Creating blurred background for pillarboxing (blur: %s, gradient: %s)", blur_strength, gradient_blend)
+                # Background and video are produced together in one per-frame pass
+                return self._create_blurred_background(clip, (new_width, height), blur_strength, gradient_blend,
+                                                       composite_foreground=True)
             else:
                 background = ColorClip(
                     size=(new_width, height),
@@ -907,142 +1837,318 @@ class VideoProcessor:
         
         return clip.resize(newsize=(target_width, target_height))
     
-    def _validate_input(self, file_path: str) -> bool:
-        """Validate input file path and format."""
-        if not os.path.exists(file_path):
-            print(f"Error: Input file not found - {file_path}")
-            return False
+    @staticmethod
+    def _ratio_filter(width: int, height: int, target_ratio: Tuple[int, int],
+                      resize_method: Literal['crop', 'pad', 'stretch'],
+                      pad_color: Tuple[int, int, int]) -> Tuple[Optional[str], Tuple[int, int]]:
+        """
+        ffmpeg filter matching _crop_to_ratio, _pad_to_ratio (solid color) or _stretch_to_ratio.
+        
+        Returns:
+            The filter (None if frames pass through unchanged) and the resulting (width, height).
+        """
+        target_ratio_decimal = target_ratio[0] / target_ratio[1]
+        current_ratio = width / height
+        if resize_method == 'crop':
+            if current_ratio > target_ratio_decimal:
+                new_width = int(height * target_ratio_decimal)
+                x1 = width // 2 - new_width // 2
+                crop_width = (width // 2 + new_width // 2) - x1
+                return f"crop={crop_width}:{height}:{x1}:0", (crop_width, height)
+            new_height = int(width / target_ratio_decimal)
+            y1 = height // 2 - new_height // 2
+            crop_height = (height // 2 + new_height // 2) - y1
+            return f"crop={width}:{crop_height}:0:{y1}", (width, crop_height)
+        if resize_method == 'pad':
+            if abs(current_ratio - target_ratio_decimal) < 0.01:
+                return None, (width, height)
+            color = '0x{:02x}{:02x}{:02x}'.format(*pad_color)
+            if current_ratio > target_ratio_decimal:
+                new_height = int(width / target_ratio_decimal)
+                new_height += new_height % 2
+                return f"pad={width}:{new_height}:0:{(new_height - height) // 2}:color={color}", (width, new_height)
+            new_width = int(height * target_ratio_decimal)
+            new_width += new_width % 2
+            return f"pad={new_width}:{height}:{(new_width - width) // 2}:0:color={color}", (new_width, height)
+        if resize_method == 'stretch':
+            target_width = max(width, height)
+            target_height = int(target_width / target_ratio_decimal)
+            return f"scale={target_width}:{target_height}", (target_width, target_height)
+        raise ValueError(f"Unsupported resize method: {resize_method}")
+    
+    def _validate_input(self, file_path: str) -> Optional[os.stat_result]:
+        """
+        Validate input file path and format.
+        
+        Returns:
+            The file's stat result (truthy) if valid, so callers need no second stat; None otherwise
+        """
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            logger.error("Error: Input file not found - %s", file_path)
+            return None
         
         _, ext = os.path.splitext(file_path)
         if ext.lower() not in self.supported_formats:
-            print(f"Error: Unsupported file format - {ext}")
-            return False
+            logger.error("Error: Unsupported file format - %s", ext)
+            return None
             
-        return True
+        return st
 
-    def _get_video_info_ffprobe(self, file_path: str) -> Optional[Dict[str, Any]]:
+    @staticmethod
+    def _get_video_info_pyav(file_path: str) -> Optional[VideoInfo]:
         """
-        Get video information using ffprobe for faster metadata extraction.
+        Get video information in-process with PyAV, avoiding the ffprobe subprocess.
         
         Args:
             file_path: Path to the video file.
             
         Returns:
-            A dictionary containing video information (duration, fps, size, aspect_ratio, has_audio)
-            or None if information cannot be retrieved.
+            A VideoInfo, or None if PyAV is unavailable, cannot read the file or cannot tell its
+            rotation (MP4/MOV/Matroska, which ffprobe handles).
         """
-        import time
-        import logging
+        if av is None or file_path.lower().endswith(_PYAV_ROTATABLE_EXTENSIONS):
+            return None
+        
+        try:
+            with av.open(file_path, metadata_errors='ignore') as container:
+                video_stream = next((s for s in container.streams if s.type == 'video'), None)
+                if video_stream is None:
+                    logger.error("Error: No video stream found in %s", file_path)
+                    return None
+                
+                # Duration - try stream first, then container (same order as the ffprobe path)
+                if video_stream.duration is not None and video_stream.time_base is not None:
+                    duration = float(video_stream.duration * video_stream.time_base)
+                elif container.duration is not None:
+                    duration = container.duration / av.time_base
+                else:
+                    logger.warning("Warning: Duration not found by PyAV for %s. Defaulting to 0.", file_path)
+                    duration = 0.0
+                
+                fps = float(video_stream.average_rate) if video_stream.average_rate else 0.0
+                width = int(video_stream.width or 0)
+                height = int(video_stream.height or 0)
+                aspect_ratio = float(width) / float(height) if height != 0 else 1.0
+                has_audio = any(s.type == 'audio' for s in container.streams)
+                codec_name = video_stream.codec_context.name or ''
+                
+                # Newer FFmpeg reports rotation only as display matrix side data, which PyAV does
+                # not expose; a mislabeled MP4/MOV/Matroska file without a rotate tag goes to ffprobe
+                rotate_tag = video_stream.metadata.get('rotate')
+                if rotate_tag is None and _PYAV_ROTATABLE_FORMATS.intersection(container.format.name.split(',')):
+                    return None
+                rotation = _normalize_rotation(rotate_tag or 0)
+            
+            return VideoInfo(duration, fps, width, height, aspect_ratio, has_audio, codec_name, rotation)
+        except Exception as e:
+            logger.warning("PyAV could not probe %s, falling back to ffprobe: %s", file_path, e)
+            return None
+
+    @staticmethod
+    def _get_video_info_ffprobe(file_path: str) -> Optional[VideoInfo]:
+        """
+        Get video information using ffprobe for faster metadata extraction.
         
-        method_start_time = time.time()
-        logging.debug(f"_get_video_info_ffprobe started for: {file_path}")
+        Args:
+            file_path: Path to the video file.
+            
+        Returns:
+            A VideoInfo, or None if information cannot be retrieved.
+        """
+        logger.debug("_get_video_info_ffprobe started for: %s", file_path)
         
         try:
-            # Time the command construction
-            cmd_start_time = time.time()
-            command = [
-                'ffprobe',
-                '-v', 'quiet',                    # Suppress verbose output
-                '-print_format', 'json',          # JSON output format
-                '-show_streams',                  # Show stream information
-                '-show_format',                   # Show format information for duration fallback
-                '-select_streams', 'v:0',         # Only analyze first video stream for speed
-                '-probesize', '1048576',          # Limit probe size for faster analysis (1MB)
-                '-analyzeduration', '1000000',    # Limit analysis duration (1 second)
-                file_path
-            ]
-            cmd_duration = time.time() - cmd_start_time
-            logging.debug(f"Optimized command construction took {cmd_duration:.4f} seconds")
-            
-            # Time the subprocess execution
-            subprocess_start_time = time.time()
-            result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True, text=True, timeout=10)
-            subprocess_duration = time.time() - subprocess_start_time
-            logging.debug(f"Optimized ffprobe subprocess execution took {subprocess_duration:.4f} seconds")
-            
-            # Time JSON parsing
-            json_start_time = time.time()
-            data = json.loads(result.stdout)
-            json_duration = time.time() - json_start_time
-            logging.debug(f"JSON parsing took {json_duration:.4f} seconds")
-            
-            # Time stream processing
-            stream_start_time = time.time()
+            # Stream fields only: most containers carry a per-stream duration, so the
+            # format section is only requested below when it is actually missing
+            data = VideoProcessor._run_ffprobe(
+                file_path, 'stream=codec_type,codec_name,width,height,duration,avg_frame_rate'
+                           ':stream_tags=rotate:stream_side_data=rotation')
+            
             video_stream = None
             audio_stream = None
             
             for stream in data.get('streams', []):
                 if stream.get('codec_type') == 'video':
-                    video_stream = stream
+                    if video_stream is None:  # Use the first video stream
+                        video_stream = stream
                 elif stream.get('codec_type') == 'audio':
                     audio_stream = stream
             
             if not video_stream:
-                logging.error(f"Error: No video stream found in {file_path}")
+                logger.error("Error: No video stream found in %s", file_path)
                 return None
 
             # Duration - try stream first, then format
             duration_str = video_stream.get('duration')
             if not duration_str:
                 # Fallback to container format duration if stream duration is missing
-                format_info = data.get('format', {})
+                format_info = VideoProcessor._run_ffprobe(file_path, 'format=duration').get('format', {})
                 duration_str = format_info.get('duration')
 
             if duration_str:
                 duration = float(duration_str)
             else:
                 # If still no duration, log warning and use 0
-                logging.warning(f"Warning: Duration not found by ffprobe for {file_path}. Defaulting to 0.")
+                logger.warning("Warning: Duration not found by ffprobe for %s. Defaulting to 0.", file_path)
                 duration = 0.0
 
             # FPS
             avg_frame_rate = video_stream.get('avg_frame_rate', "0/0")
-            if '/' in avg_frame_rate:
-                num, den = map(int, avg_frame_rate.split('/'))
-                fps = float(num) / float(den) if den != 0 else 0.0
-            else:
-                fps = float(avg_frame_rate)
+            fps = _FPS_CACHE.get(avg_frame_rate) or VideoProcessor._parse_rate(avg_frame_rate)
 
-            # Size and Aspect Ratio
-            width = int(video_stream.get('width', 0))
-            height = int(video_stream.get('height', 0))
-            
-            aspect_ratio = float(width) / float(height) if height != 0 else 1.0
+            # Size and Aspect Ratio (convert once; ints are derived from the floats)
+            w = float(video_stream.get('width') or 0)
+            h = float(video_stream.get('height') or 0)
+            aspect_ratio = w / h if h else 1.0
+            width, height = int(w), int(h)
 
             has_audio = audio_stream is not None
+            codec_name = video_stream.get('codec_name', '')
+            rotation = VideoProcessor._stream_rotation(video_stream)
             
-            stream_duration = time.time() - stream_start_time
-            logging.debug(f"Stream data processing took {stream_duration:.4f} seconds")
-            
-            method_duration = time.time() - method_start_time
-            logging.debug(f"_get_video_info_ffprobe TOTAL TIME: {method_duration:.4f} seconds")
-            logging.debug(f"OPTIMIZED FFPROBE BREAKDOWN: cmd={cmd_duration:.4f}s, subprocess={subprocess_duration:.4f}s, json={json_duration:.4f}s, stream={stream_duration:.4f}s")
-            
-            return {
-                'duration': duration,
-                'fps': fps,
-                'size': [width, height],
-                'aspect_ratio': aspect_ratio,
-                'has_audio': has_audio
-            }
+            return VideoInfo(duration, fps, width, height, aspect_ratio, has_audio, codec_name, rotation)
 
         except subprocess.TimeoutExpired:
-            logging.error(f"ffprobe timeout for {file_path}")
+            logger.error("ffprobe timeout for %s", file_path)
             return None
         except subprocess.CalledProcessError as e:
-            logging.error(f"Error running ffprobe: {e}\nStderr: {e.stderr}")
+            logger.error("Error running ffprobe: %s\nStderr: %s", e, e.stderr.decode(errors='ignore') if e.stderr else '')
             return None
-        except json.JSONDecodeError:
-            logging.error(f"Error parsing ffprobe JSON output for {file_path}")
+        except ValueError:
+            logger.error("Error parsing ffprobe output for %s", file_path)
             return None
         except Exception as e:
-            logging.error(f"An unexpected error occurred in _get_video_info_ffprobe: {str(e)}")
+            logger.error("An unexpected error occurred in _get_video_info_ffprobe: %s", e)
             return None
 
+    @staticmethod
+    def _run_ffprobe(file_path: str, show_entries: str, extra_args: Tuple[str, ...] = ()) -> Dict[str, Any]:
+        """
+        Run ffprobe for the given -show_entries selection and parse its flat output.
+        
+        Args:
+            file_path: File to probe
+            show_entries: The -show_entries selection
+            extra_args: Further ffprobe options (e.g. -show_data_hash)
+        
+        Raises:
+            subprocess.CalledProcessError, subprocess.TimeoutExpired: if ffprobe fails.
+        """
+        command = (_ffprobe_executable(), *_FFPROBE_ARGS, *extra_args, '-show_entries', show_entries, '-i', file_path)
+        
+        # CPython launches via posix_spawn (no fork of this process's heap) only when the
+        # executable path contains a directory, close_fds is False and no preexec_fn, cwd,
+        # pass_fds or start_new_session is given. Keep these arguments that way; closing fds
+        # is unnecessary because Python creates file descriptors non-inheritable by default.
+        # ffprobe runs with -v quiet, so stderr is only worth a pipe when someone reads debug logs
+        stderr_target = subprocess.PIPE if logger.isEnabledFor(logging.DEBUG) else subprocess.DEVNULL
+        with _timed("ffprobe execution and parsing"):
+            with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=stderr_target,
+                                  close_fds=False) as proc:
+                # Kill ffprobe if it hangs; reading stdout line by line has no timeout of its own
+                timed_out = threading.Event()
+                
+                def kill_on_timeout():
+                    timed_out.set()
+                    proc.kill()
+                
+                watchdog = threading.Timer(10, kill_on_timeout)
+                watchdog.start()
+                try:
+                    # Parse lines as ffprobe emits them instead of buffering all of stdout first
+                    data = VideoProcessor._parse_ffprobe_flat(proc.stdout)
+                    stderr = proc.stderr.read() if proc.stderr is not None else None
+                    returncode = proc.wait()
+                finally:
+                    watchdog.cancel()
+        
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(command, 10, stderr=stderr)
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, command, stderr=stderr)
+        return data
+
+    @staticmethod
+    def _stream_signature(file_path: str) -> Tuple[Tuple[Optional[str], ...], ...]:
+        """
+        Describe a file's streams by the fields that must match for concat stream copy.
+        
+        Returns:
+            One tuple per stream (the _CONCAT_COPY_FIELDS values and the rotation), or an empty
+            tuple if ffprobe fails.
+        """
+        show_entries = f"stream={','.join(_CONCAT_COPY_FIELDS)}:stream_tags=rotate:stream_side_data=rotation"
+        try:
+            data = VideoProcessor._run_ffprobe(file_path, show_entries, ('-show_data_hash', 'sha256'))
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.debug("Stream signature probe failed for %s: %s", file_path, e)
+            return ()
+        return tuple((*(stream.get(field) for field in _CONCAT_COPY_FIELDS), VideoProcessor._stream_rotation(stream))
+                     for stream in data['streams'])
+
+    @staticmethod
+    def _stream_rotation(stream: Dict[str, str]) -> int:
+        """
+        Rotation of a parsed ffprobe stream: the display matrix side data when present (what
+        ffmpeg applies), otherwise the legacy rotate tag.
+        """
+        for key, value in stream.items():
+            if key.endswith('.rotation'):
+                return _normalize_rotation(value)
+        return _normalize_rotation(stream.get('tags.rotate', 0))
+
+    @staticmethod
+    def _parse_rate(rate: str) -> float:
+        """Convert an ffprobe rate such as '30000/1001' (or a plain number) to a float."""
+        if not rate or rate == '0/0':
+            return 0.0
+        try:
+            # Fraction keeps the rate exact until the final conversion
+            return float(Fraction(rate))
+        except ZeroDivisionError:
+            return 0.0
+
+    @staticmethod
+    def _parse_ffprobe_flat(lines: Iterable[bytes]) -> Dict[str, Any]:
+        """
+        Parse ffprobe's `-print_format flat` output into the same shape as its JSON output.
+        
+        Lines look like `streams.stream.0.codec_type="video"` or `format.duration="12.5"`;
+        nested stream entries keep the rest of their path as the key (`tags.rotate`,
+        `side_data_list.side_data.0.rotation`). Fields ffprobe reports as N/A are left out. Parsing works on the raw bytes and only
+        the few matched keys/values are decoded, so stdout is never decoded as a whole.
+        
+        Args:
+            lines: Raw ffprobe stdout lines (e.g. the stdout pipe or bytes.splitlines()).
+            
+        Returns:
+            A dictionary with a 'streams' list (ordered by stream index) and a 'format' dict.
+        """
+        streams: Dict[int, Dict[str, str]] = {}
+        format_info: Dict[str, str] = {}
+        for line in lines:
+            key, sep, value = line.partition(b'=')
+            if not sep:
+                continue
+            value = value.rstrip(b'\r\n').strip(b'"')
+            if value == b'N/A':
+                continue
+            parts = key.split(b'.')
+            if len(parts) >= 4 and parts[0] == b'streams':
+                streams.setdefault(int(parts[2]), {})[b'.'.join(parts[3:]).decode('ascii')] = value.decode()
+            elif len(parts) == 2 and parts[0] == b'format':
+                format_info[parts[1].decode('ascii')] = value.decode()
+        return {
+            'streams': [streams[index] for index in sorted(streams)],
+            'format': format_info
+        }
+
     def get_video_info(self, file_path: str) -> Optional[dict]:
         """
         Get video information (duration, fps, size, aspect_ratio, has_audio).
-        Uses ffprobe for speed.
+        Uses PyAV in-process when available, falling back to ffprobe.
         
         Args:
             file_path: Path to the video file.
@@ -1050,70 +2156,161 @@ class VideoProcessor:
         Returns:
             A dictionary containing video information or None if info cannot be retrieved.
         """
-        method_start_time = time.time()
-        logging.debug(f"get_video_info started for: {file_path}")
+        info = self._probe_video_info(file_path)
+        return info.as_dict() if info else None
+
+    def get_video_info_batch(self, file_paths: List[str]) -> List[Optional[dict]]:
+        """
+        Get video information for several files at once.
+        
+        The probes run concurrently (each is a PyAV read or an ffprobe subprocess, so
+        threads overlap them without a process pool) and share get_video_info's cache.
+        
+        Args:
+            file_paths: Paths to the video files.
+            
+        Returns:
+            One dictionary (as returned by get_video_info) or None per path, in order.
+        """
+        return [info.as_dict() if info else None for info in self._batch_probe(file_paths)]
+
+    def _probe_video_info(self, file_path: str) -> Optional[VideoInfo]:
+        """Validate the path and return its (cached) VideoInfo, or None on failure."""
+        logger.debug("get_video_info started for: %s", file_path)
         
-        # Time input validation
-        validation_start_time = time.time()
-        if not self._validate_input(file_path):
+        # Validation is a stat plus an extension check; timing it would cost more than it does
+        st = self._validate_input(file_path)
+        if not st:
             return None
-        validation_duration = time.time() - validation_start_time
-        logging.debug(f"Input validation took {validation_duration:.4f} seconds")
-        
-        # Time the ffprobe method call
-        ffprobe_start_time = time.time()
-        info = self._get_video_info_ffprobe(file_path)
-        ffprobe_duration = time.time() - ffprobe_start_time
-        logging.debug(f"_get_video_info_ffprobe call took {ffprobe_duration:.4f} seconds")
-        
-        if not info: # Fallback or additional logging if ffprobe fails
-            logging.error(f"ffprobe failed to get info for {file_path}. MoviePy fallback NOT implemented yet.")
-            # As a potential future improvement, could fallback to MoviePy here if ffprobe fails for some edge cases
-            # For now, just returning None as per ffprobe's result.
-            # clip = VideoFileClip(file_path)
-            # info = {
-            #     'duration': clip.duration,
-            #     'fps': clip.fps,
-            #     'size': list(clip.size),
-            #     'aspect_ratio': clip.aspect_ratio,
-            #     'has_audio': clip.audio is not None
-            # }
-            # clip.close()
-        
-        method_duration = time.time() - method_start_time
-        logging.debug(f"get_video_info TOTAL TIME: {method_duration:.4f} seconds")
+        
+        # Cached per path/mtime/size (from the validation stat); PyAV first, ffprobe as fallback.
+        # abspath is pure string work, unlike realpath's lstat of every path component
+        with _timed("Video probe call"):
+            info = _cached_video_info(os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+        
+        if not info:
+            logger.error("Could not read video info for %s (neither PyAV nor ffprobe could probe it)", file_path)
         
         return info
 
+    def _batch_probe(self, paths: List[str]) -> List[Optional[VideoInfo]]:
+        """
+        Probe several files concurrently, so N probes take about as long as one.
+        
+        Results share the per-path/mtime cache used by get_video_info.
+        
+        Returns:
+            One VideoInfo (or None on failure) per path, in order.
+        """
+        return _run_concurrently(self._probe_video_info, paths)
+
+    @staticmethod
+    def clear_video_info_cache(persistent: bool = False) -> None:
+        """
+        Forget cached video information.
+        
+        Args:
+            persistent: Also delete the on-disk cache at PROBE_CACHE_PATH.
+        """
+        global _probe_disk_cache
+        with _video_info_cache_lock:
+            _video_info_cache.clear()
+        if persistent:
+            with _probe_disk_cache_lock:
+                _probe_disk_cache = {}
+                _probe_disk_pending.clear()
+                try:
+                    os.remove(PROBE_CACHE_PATH)
+                except OSError:
+                    pass
+
     def add_watermark(self, input_path: str, output_path: str, watermark_path: str, position: Optional[str] = 'bottom-right', quality_preset_override: Optional[str] = None):
+        """
+        Overlay watermark image at the specified position.
+        
+        Uses a single ffmpeg overlay filter (audio is stream-copied) and falls back to
+        MoviePy composition if ffmpeg is unavailable or fails.
+        """
+        if self._add_watermark_ffmpeg(input_path, output_path, watermark_path, position, quality_preset_override):
+            return True
+        logger.warning("FFmpeg watermark overlay failed. Falling back to MoviePy method.")
+        return self._add_watermark_moviepy(input_path, output_path, watermark_path, position, quality_preset_override)
+
+    def _add_watermark_ffmpeg(self, input_path: str, output_path: str, watermark_path: str, position: Optional[str] = 'bottom-right', quality_preset_override: Optional[str] = None) -> bool:
+        """
+        Overlay watermark image with ffmpeg's scale + overlay filters in one pass.
+        
+        The watermark is scaled to 15% of the video height and placed with a 20px margin,
+        matching the MoviePy implementation.
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        info = self._probe_video_info(input_path)
+        if not info:
+            return False
+        
+        # 15% of the displayed height (ffmpeg overlays onto auto-rotated frames), as video.h in MoviePy
+        watermark_height = int(info.display_size[1] * 0.15)
+        overlay_position = _WATERMARK_OVERLAY_POSITIONS.get(position, _WATERMARK_OVERLAY_POSITIONS['top-left'])
+        filter_graph = f"[1:v]scale=-1:{watermark_height}[wm];[0:v][wm]overlay={overlay_position}[v]"
+        
+        command = [
+            'ffmpeg', '-y',
+            *self._hwaccel_input_args(input_path, quality_preset_override),
+            '-i', input_path,
+            '-i', watermark_path,
+            '-filter_complex', filter_graph,
+            '-map', '[v]',
+            '-map', '0:a?',  # Keep audio if present; it is stream-copied, never re-encoded
+            *self.get_encoding_params_as_cli(quality_preset=quality_preset_override),
+            '-c:a', 'copy',
+            output_path
+        ]
+        return self._run_ffmpeg(command, "watermark overlay")
+
+    def _add_watermark_moviepy(self, input_path: str, output_path: str, watermark_path: str, position: Optional[str] = 'bottom-right', quality_preset_override: Optional[str] = None) -> bool:
         """Overlay watermark image at the specified position using MoviePy."""
-        from moviepy.editor import VideoFileClip, ImageClip, CompositeVideoClip
+        video = final = None
         try:
+            from moviepy.editor import VideoFileClip
             video = VideoFileClip(input_path)
-            watermark = ImageClip(watermark_path).set_duration(video.duration).resize(height=int(video.h * 0.15))
-            # Default margin
-            margin = 20
-            pos = (margin, margin)
-            if position == 'top-left':
-                pos = (margin, margin)
-            elif position == 'top-right':
-                pos = (video.w - watermark.w - margin, margin)
-            elif position == 'bottom-left':
-                pos = (margin, video.h - watermark.h - margin)
-            elif position == 'bottom-right':
-                pos = (video.w - watermark.w - margin, video.h - watermark.h - margin)
-            elif position == 'center':
-                pos = ('center', 'center')
-            watermark = watermark.set_pos(pos)
-            final = CompositeVideoClip([video, watermark])
+            final = self._watermark_clip(video, watermark_path, position)
             final.write_videofile(output_path, **self.get_encoding_params(quality_preset=quality_preset_override))
-            video.close()
-            watermark.close()
-            final.close()
             return True
         except Exception as e:
-            print(f"Error adding watermark: {e}")
+            logger.exception("Error adding watermark: %s", e)
             return False
+        finally:
+            # Release MoviePy's ffmpeg readers even when writing fails
+            for clip_obj in (final, video):
+                if clip_obj is not None:
+                    clip_obj.close()
+
+    @staticmethod
+    def _watermark_clip(video, watermark_path: str, position: Optional[str] = 'bottom-right'):
+        """Return the in-memory clip with the watermark image blended into every frame."""
+        watermark_array = _scaled_watermark(watermark_path, os.stat(watermark_path).st_mtime_ns, int(video.h * 0.15))
+        watermark_h, watermark_w = watermark_array.shape[:2]
+        # Default margin
+        margin = 20
+        pos = (margin, margin)
+        if position == 'top-left':
+            pos = (margin, margin)
+        elif position == 'top-right':
+            pos = (video.w - watermark_w - margin, margin)
+        elif position == 'bottom-left':
+            pos = (margin, video.h - watermark_h - margin)
+        elif position == 'bottom-right':
+            pos = (video.w - watermark_w - margin, video.h - watermark_h - margin)
+        elif position == 'center':
+            pos = ((video.w - watermark_w) // 2, (video.h - watermark_h) // 2)
+        # Premultiply the logo's alpha once; each frame is then a single multiply-add over the logo region
+        premultiplied = premultiply_alpha(watermark_array)
+        warm_up_kernels()
+        # Composite into reused buffers instead of allocating a frame copy per frame
+        outputs = buffer_ring((video.h, video.w, 3))
+        return video.fl_image(lambda frame: alpha_composite(frame, premultiplied, *pos, out=next(outputs)))
     
     def adjust_brightness(self, input_path: str, output_path: str, brightness_factor: float):
         """Placeholder for brightness adjustment functionality."""
@@ -1123,55 +2320,68 @@ class VideoProcessor:
         """Placeholder for frame extraction functionality."""
         pass
 
-    def _apply_blur(self, clip, blur_radius):
+    def _blur_frame_function(self, size: Tuple[int, int], blur_radius: int):
         """
-        Apply blur effect using a robust downscale-upscale method.
+        Build a per-frame blur using a robust downscale-upscale method.
         Optimized for performance with automatic scaling based on resolution.
         
         Args:
-            clip: Video clip to blur
+            size: Frame size (width, height)
             blur_radius: Blur radius (higher = more blur)
             
         Returns:
-            Blurred video clip
+            Function mapping an RGB frame of that size to its blurred copy
         """
-        try:
-            original_size = clip.size
-            width, height = original_size
-            total_pixels = width * height
-            
-            # Performance optimization: Adjust blur quality based on resolution
-            if total_pixels > 8294400:  # > 4K (3840x2160)
-                print(f"🚀 Ultra-high resolution detected ({width}x{height}) - using aggressive blur optimization")
-                blur_factor = max(4, blur_radius // 2)  # More aggressive downscaling for 4K+
-            elif total_pixels > 2073600:  # > 1920x1080
-                print(f"🚀 High resolution detected ({width}x{height}) - using optimized blur")
-                blur_factor = max(3, blur_radius // 3)  # Moderate optimization for high-res
-            else:
-                print(f"📐 Standard resolution ({width}x{height}) - using standard blur")
-                blur_factor = max(2, blur_radius // 4)  # Original algorithm for standard res
-            
-            # Calculate new size for blur effect
-            new_width = max(16, original_size[0] // blur_factor)  # Minimum 16 pixels wide
-            new_height = max(16, original_size[1] // blur_factor)  # Minimum 16 pixels tall
-            
-            # Ensure dimensions are even
-            new_width = new_width if new_width % 2 == 0 else new_width + 1
-            new_height = new_height if new_height % 2 == 0 else new_height + 1
-            
-            print(f"🔧 Blur optimization: {width}x{height} → {new_width}x{new_height} → {width}x{height} (factor: {blur_factor})")
-            
-            # Apply blur by downscaling then upscaling
-            blurred_clip = clip.resize((new_width, new_height)).resize(original_size)
-            
-            return blurred_clip
-            
-        except Exception as e:
-            print(f"Warning: Error applying blur effect: {str(e)}")
-            # Return original clip if blur fails
-            return clip
+        width, height = size
+        total_pixels = width * height
+        
+        # Performance optimization: Adjust blur quality based on resolution
+        if total_pixels > 8294400:  # > 4K (3840x2160)
+            logger.debug("Ultra-high resolution detected (%sx%s) - using aggressive blur optimization", width, height)
+        elif total_pixels > 2073600:  # > 1920x1080
+            logger.debug("High resolution detected (%sx%s) - using optimized blur", width, height)
+        else:
+            logger.debug("Standard resolution (%sx%s) - using standard blur", width, height)
+        blur_factor = self._blur_factor(total_pixels, blur_radius)
+        
+        # Calculate new size for blur effect
+        new_width = max(16, width // blur_factor)  # Minimum 16 pixels wide
+        new_height = max(16, height // blur_factor)  # Minimum 16 pixels tall
+        
+        # Ensure dimensions are even
+        new_width = new_width if new_width % 2 == 0 else new_width + 1
+        new_height = new_height if new_height % 2 == 0 else new_height + 1
+        
+        # A true Gaussian (sigma of half the radius) run on the downscaled frame, so its kernel
+        # stays a few pixels wide however strong the blur
+        sigma = max(1.0, blur_radius / 2 / blur_factor)
+        
+        logger.debug("Blur optimization: %sx%s → %sx%s → %sx%s (factor: %s, sigma: %.1f)", width, height, new_width, new_height, width, height, blur_factor, sigma)
+        
+        # Downscale (area averaging), Gaussian blur and upscale, one OpenCV call each per frame;
+        # with an OpenCL device they run there through UMat
+        use_opencl = cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL()
+        
+        def blur_frame(frame):
+            src = cv2.UMat(frame) if use_opencl else frame
+            small = cv2.resize(src, (new_width, new_height), interpolation=cv2.INTER_AREA)
+            small = cv2.GaussianBlur(small, (0, 0), sigmaX=sigma)
+            blurred = cv2.resize(small, (width, height), interpolation=cv2.INTER_LINEAR)
+            return blurred.get() if use_opencl else blurred
+        
+        return blur_frame
 
-    def _create_blurred_background(self, clip, target_size: Tuple[int, int], blur_strength: int = 25, gradient_blend: float = 0.3):
+    @staticmethod
+    def _blur_factor(total_pixels: int, blur_radius: int) -> int:
+        """Downscale factor used to blur a frame of the given size (larger frames downscale more)."""
+        if total_pixels > 8294400:  # > 4K (3840x2160)
+            return max(4, blur_radius // 2)  # More aggressive downscaling for 4K+
+        if total_pixels > 2073600:  # > 1920x1080
+            return max(3, blur_radius // 3)  # Moderate optimization for high-res
+        return max(2, blur_radius // 4)  # Original algorithm for standard res
+
+    def _create_blurred_background(self, clip, target_size: Tuple[int, int], blur_strength: int = 25, gradient_blend: float = 0.3,
+                                   composite_foreground: bool = False):
         """
         Create a blurred background from the original video that fills the target dimensions.
         Now supports gradient blending for a bleeding effect.
@@ -1181,6 +2391,9 @@ class VideoProcessor:
             target_size: Target dimensions (width, height) for the background
             blur_strength: Strength of blur effect (1-50, higher = more blur)
             gradient_blend: Gradient blending factor (0.0-1.0) - controls bleeding effect transparency
+            composite_foreground: If True, also paste the original frame centered on the background in
+                the same per-frame pass and return the finished padded clip, instead of a background for
+                a CompositeVideoClip
             
         Returns:
             A blurred video clip that fills the target dimensions with optional gradient blend
@@ -1190,7 +2403,7 @@ class VideoProcessor:
             blur_strength = max(1, min(50, blur_strength))  # Clamp between 1-50
             gradient_blend = max(0.0, min(1.0, gradient_blend))  # Clamp between 0.0-1.0
             
-            print(f"🎨 Creating background with blur strength: {blur_strength}, gradient blend: {gradient_blend}")
+            logger.debug("Creating background with blur strength: %s, gradient blend: %s", blur_strength, gradient_blend)
             
             # Ensure target dimensions are even
             target_width, target_height = target_size
@@ -1217,10 +2430,10 @@ class VideoProcessor:
             if scaled_height % 2 != 0:
                 scaled_height += 1
             
-            print(f"🔧 Blur background: scaling from {original_width}x{original_height} to {scaled_width}x{scaled_height}, target: {target_width}x{target_height}")
+            logger.debug("Blur background: scaling from %sx%s to %sx%s, target: %sx%s", original_width, original_height, scaled_width, scaled_height, target_width, target_height)
             
-            # Resize the clip to fill the background
-            scaled_clip = clip.resize((scaled_width, scaled_height))
+            # The scaled frame's window that fills the background (all of it unless cropped below)
+            x1, y1, x2, y2 = 0, 0, scaled_width, scaled_height
             
             # If the scaled clip is larger than target, crop it to center
             if scaled_width > target_width or scaled_height > target_height:
@@ -1237,190 +2450,424 @@ class VideoProcessor:
                 x2 = min(scaled_width, x2)
                 y2 = min(scaled_height, y2)
                 
-                print(f"🔧 Cropping scaled background: ({x1}, {y1}) to ({x2}, {y2})")
-                scaled_clip = scaled_clip.crop(x1=x1, y1=y1, x2=x2, y2=y2)
+                logger.debug("Cropping scaled background: (%s, %s) to (%s, %s)", x1, y1, x2, y2)
             
-            # Apply blur effect with user-controlled strength
-            blurred_clip = self._apply_blur(scaled_clip, blur_strength)
+            # Blur with user-controlled strength
+            background_size = (x2 - x1, y2 - y1)
+            blur_frame = self._blur_frame_function(background_size, blur_strength)
             
-            # Apply gradient blend effect if requested
+            # Gradient blend effect if requested, and a subtle dim (0.8) to make the main content
+            # stand out more, premultiplied into one brightness multiplier
+            multiplier = 0.8
             if gradient_blend > 0.0:
-                print(f"🌈 Applying gradient blend effect (strength: {gradient_blend})")
-                blurred_clip = self._apply_gradient_blend(blurred_clip, gradient_blend)
+                logger.debug("Applying gradient blend effect (strength: %s)", gradient_blend)
+                gradient = self._gradient_scale(background_size, gradient_blend)
+                if gradient is not None:
+                    multiplier = gradient * 0.8
+            scale = self._fixed_point_scale(multiplier)
+            
+            # Scale, crop, blur, gradient and dim (and the foreground paste) run in a single pass per
+            # frame, into reused output buffers (the consumer is done with each frame before the next)
+            outputs = buffer_ring((background_size[1], background_size[0], 3))
+            warm_up_kernels()
+            
+            def background_frame(frame):
+                scaled = cv2.resize(frame, (scaled_width, scaled_height), interpolation=cv2.INTER_LINEAR)
+                return scale_frame(blur_frame(scaled[y1:y2, x1:x2]), scale, next(outputs))
+            
+            if composite_foreground:
+                # Centered like set_position('center'); the frame overwrites the background directly
+                # instead of MoviePy compositing two clips
+                fg_x = max(0, (background_size[0] - original_width) // 2)
+                fg_y = max(0, (background_size[1] - original_height) // 2)
+                fg_w = min(original_width, background_size[0] - fg_x)
+                fg_h = min(original_height, background_size[1] - fg_y)
+                
+                def padded_frame(frame):
+                    out = background_frame(frame)
+                    out[fg_y:fg_y + fg_h, fg_x:fg_x + fg_w] = frame[:fg_h, :fg_w]
+                    return out
+                
+                logger.debug("Blur background created successfully with dimming effect")
+                return clip.fl_image(padded_frame)
             
-            # Try to apply a subtle dim effect to make the main content stand out more
-            try:
-                # Reduce brightness slightly for better contrast with main video
-                dimmed_clip = blurred_clip.fl_image(lambda image: (image * 0.8).astype('uint8'))
-                print(f"✅ Blur background created successfully with dimming effect")
-                return dimmed_clip
-            except Exception as dim_error:
-                print(f"⚠️ Dimming effect failed, using regular blur: {dim_error}")
-                # If color multiplication doesn't work, use the regular blurred clip
-                print(f"✅ Blur background created successfully without dimming")
-                return blurred_clip
+            logger.debug("Blur background created successfully with dimming effect")
+            return clip.fl_image(background_frame)
             
         except Exception as e:
-            print(f"❌ Error creating blurred background: {str(e)}")
+            logger.error("Error creating blurred background: %s", e)
             # Fallback to a simple dark background that should work
-            from moviepy.editor import ColorClip
-            print(f"🔄 Falling back to solid dark background")
-            return ColorClip(size=target_size, color=(32, 32, 32), duration=clip.duration)
+            from moviepy.editor import ColorClip, CompositeVideoClip
+            logger.debug("Falling back to solid dark background")
+            background = ColorClip(size=target_size, color=(32, 32, 32), duration=clip.duration)
+            if composite_foreground:
+                return CompositeVideoClip([background, clip.set_position('center')])
+            return background
+
+    def _resize_aspect_ratio_nvdec(self,
+                                   input_path: str,
+                                   output_path: str,
+                                   target_ratio: Tuple[int, int],
+                                   resize_method: Literal['crop', 'stretch'],
+                                   quality_preset: Optional[str] = None) -> bool:
+        """
+        Crop or stretch to the target ratio inside the NVDEC decoder and encode with NVENC.
+        
+        The cuvid decoders crop (-crop) and scale (-resize) as part of decoding, so frames go
+        from decoder to encoder without leaving the GPU or passing through a filter.
+        
+        Returns:
+            bool: True if successful, False if the input codec has no cuvid decoder, the input is
+            rotated or ffmpeg failed
+        """
+        info = self._probe_video_info(input_path)
+        if info is None or info.codec_name not in _NVDEC_CODECS:
+            return False
+        # cuvid crops and scales in coded orientation, before any rotation is applied (and ffmpeg
+        # cannot auto-rotate frames that stay on the GPU), so rotated inputs take the MoviePy path
+        if info.rotation:
+            return False
+        
+        _, (new_width, new_height) = self._ratio_filter(info.width, info.height, target_ratio, resize_method, (0, 0, 0))
+        decoder_args = ['-c:v', f"{info.codec_name}_cuvid"]
+        if resize_method == 'crop':
+            # Same centered window as _crop_to_ratio, as margins for each edge
+            left = (info.width - new_width) // 2 if new_width < info.width else 0
+            top = (info.height - new_height) // 2 if new_height < info.height else 0
+            right = info.width - new_width - left
+            bottom = info.height - new_height - top
+            decoder_args += ['-crop', f"{top}x{bottom}x{left}x{right}"]
+        else:
+            decoder_args += ['-resize', f"{new_width}x{new_height}"]
+        
+        command = [
+            'ffmpeg', '-y',
+            '-hwaccel', 'cuda', '-hwaccel_output_format', 'cuda',
+            *decoder_args,
+            '-i', input_path,
+            '-map', '0:v:0',
+            '-map', '0:a?',
+            *_without_pix_fmt(self.get_encoding_params_as_cli(quality_preset=quality_preset, include_audio=True)),
+            output_path
+        ]
+        return self._run_ffmpeg(command, f"NVDEC {resize_method}")
+
+    def _pad_to_ratio_blur_cuda(self,
+                                input_path: str,
+                                output_path: str,
+                                target_ratio: Tuple[int, int],
+                                blur_strength: int,
+                                quality_preset: Optional[str] = None) -> bool:
+        """
+        Letterbox/pillarbox over a blurred, dimmed copy of the video using NVDEC, CUDA filters and NVENC.
+        
+        Mirrors _create_blurred_background without gradient: the background is scaled down on the
+        GPU to the size the CPU blur would use, the small frame is cropped and dimmed after
+        hwdownload (cheap at that size; ffmpeg has no CUDA crop/dim filters), then uploaded, scaled
+        up and overlaid with the full-resolution frame, which never leaves the GPU.
+        
+        Returns:
+            bool: True if successful, False if not applicable (no NVDEC codec, rotated input, ratio
+            already matches) or ffmpeg failed
+        """
+        info = self._probe_video_info(input_path)
+        if info is None or info.codec_name not in _NVDEC_CODECS:
+            return False
+        # Frames stay on the GPU, where ffmpeg cannot auto-rotate them; the CPU graph handles rotation
+        if info.rotation:
+            return False
+        pad_filter, (target_width, target_height) = self._ratio_filter(
+            info.width, info.height, target_ratio, 'pad', (0, 0, 0))
+        if pad_filter is None:
+            return False
+        x = (target_width - info.width) // 2
+        y = (target_height - info.height) // 2
+        
+        blur_strength = max(1, min(50, blur_strength))
+        blur_factor = self._blur_factor(target_width * target_height, blur_strength)
+        small_width, small_height, cover_width, cover_height = self._blur_background_geometry(
+            info.width, info.height, target_width, target_height, blur_factor)
+        
+        dim = _DIM_BACKGROUND_FILTER
+        filter_graph = (
+            f"[0:v]split=2[bg][fg];"
+            f"[bg]scale_cuda={cover_width}:{cover_height},hwdownload,format=nv12,"
+            f"crop={small_width}:{small_height}:{(cover_width - small_width) // 2}:{(cover_height - small_height) // 2},"
+            f"{dim},hwupload_cuda,scale_cuda={target_width}:{target_height}[bgb];"
+            f"[bgb][fg]overlay_cuda=x={x}:y={y}[v]"
+        )
+        encode_args = _without_pix_fmt(self.get_encoding_params_as_cli(quality_preset=quality_preset, include_audio=True))
+        command = [
+            'ffmpeg', '-y',
+            '-init_hw_device', 'cuda=cu', '-filter_hw_device', 'cu',
+            '-hwaccel', 'cuda', '-hwaccel_output_format', 'cuda',
+            '-i', input_path,
+            '-filter_complex', filter_graph,
+            '-map', '[v]',
+            '-map', '0:a?',
+            *encode_args,
+            output_path
+        ]
+        return self._run_ffmpeg(command, "CUDA blur background")
+
+    @staticmethod
+    def _blur_background_geometry(width: int, height: int, target_width: int, target_height: int,
+                                  blur_factor: int) -> Tuple[int, int, int, int]:
+        """
+        Sizes for building a blurred background with ffmpeg.
+        
+        Returns:
+            (small_width, small_height, cover_width, cover_height): the reduced size the blur runs
+            at (as in _blur_frame_function) and the size the video is scaled to so that it covers
+            it before the center crop (as _create_blurred_background does)
+        """
+        small_width = max(16, target_width // blur_factor)
+        small_height = max(16, target_height // blur_factor)
+        small_width += small_width % 2
+        small_height += small_height % 2
+        # Scale so the small background covers its box, then center crop (as the MoviePy path does)
+        scale = max(small_width / width, small_height / height)
+        cover_width = max(small_width, round(width * scale))
+        cover_height = max(small_height, round(height * scale))
+        cover_width += cover_width % 2
+        cover_height += cover_height % 2
+        return small_width, small_height, cover_width, cover_height
+
+    def _pad_to_ratio_blur_ffmpeg(self,
+                                  input_path: str,
+                                  output_path: str,
+                                  target_ratio: Tuple[int, int],
+                                  blur_strength: int,
+                                  gradient_blend: float,
+                                  quality_preset: Optional[str] = None,
+                                  start_time: Optional[float] = None,
+                                  end_time: Optional[float] = None) -> bool:
+        """
+        Letterbox/pillarbox over a blurred, dimmed copy of the video in one ffmpeg filter graph.
+        
+        Mirrors _create_blurred_background with ffmpeg's own filters: the background is scaled to
+        cover the reduced blur size, center cropped, Gaussian blurred (gblur) and scaled back up,
+        then multiplied by the same gradient and dim multiplier (rendered once as a grayscale
+        image) before the original frame is overlaid.
+        
+        Args:
+            start_time, end_time: Optional trim (seconds), applied while reading the input
+        
+        Returns:
+            bool: True if successful, False if not applicable (ratio already matches) or ffmpeg failed
+        """
+        info = self._probe_video_info(input_path)
+        if info is None:
+            return False
+        trim_args = []
+        if start_time is not None and end_time is not None:
+            # Input seeking resets timestamps to 0
+            trim_args = ['-ss', str(max(start_time, 0)), '-t', str(end_time - max(start_time, 0))]
+        
+        with tempfile.TemporaryDirectory() as mask_dir:
+            # Frames reach the graph already auto-rotated, so work from the displayed size
+            graph = self._blur_pad_graph(info.display_size, target_ratio, blur_strength, gradient_blend,
+                                         '[0:v]', 'v', mask_dir, 1)
+            if graph is None:
+                return False
+            filter_graph, mask_path = graph
+            mask_args = ['-loop', '1', '-i', mask_path] if mask_path else []
+            command = [
+                'ffmpeg', '-y',
+                *trim_args,
+                '-i', input_path,
+                *mask_args,
+                '-filter_complex', filter_graph,
+                '-map', '[v]',
+                '-map', '0:a?',
+                *self.get_encoding_params_as_cli(quality_preset=quality_preset, include_audio=True),
+                output_path
+            ]
+            return self._run_ffmpeg(command, "blur background")
+
+    def _blur_pad_graph(self,
+                        size: Tuple[int, int],
+                        target_ratio: Tuple[int, int],
+                        blur_strength: int,
+                        gradient_blend: float,
+                        source: str,
+                        label: str,
+                        mask_dir: str,
+                        mask_input: int) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        ffmpeg filter graph for _pad_to_ratio_blur_ffmpeg, from one video label to another.
+        
+        Args:
+            size: Size of the frames entering the graph (width, height)
+            target_ratio, blur_strength, gradient_blend: As for resize_aspect_ratio
+            source: Input label, e.g. '[0:v]'
+            label: Name of the output label (without brackets); also prefixes the graph's internal labels
+            mask_dir: Directory to write the gradient mask image into
+            mask_input: ffmpeg input index the mask image will be given, if one is needed
+        
+        Returns:
+            (filter graph, mask image path or None), or None if the ratio already matches
+        """
+        width, height = size
+        pad_filter, (target_width, target_height) = self._ratio_filter(
+            width, height, target_ratio, 'pad', (0, 0, 0))
+        if pad_filter is None:
+            return None
+        x = (target_width - width) // 2
+        y = (target_height - height) // 2
+        
+        blur_strength = max(1, min(50, blur_strength))
+        gradient_blend = max(0.0, min(1.0, gradient_blend))
+        blur_factor = self._blur_factor(target_width * target_height, blur_strength)
+        small_width, small_height, cover_width, cover_height = self._blur_background_geometry(
+            width, height, target_width, target_height, blur_factor)
+        sigma = max(1.0, blur_strength / 2 / blur_factor)
+        
+        background = (
+            f"{source}split=2[{label}_bg][{label}_fg];"
+            f"[{label}_bg]scale={cover_width}:{cover_height}:flags=area,"
+            f"crop={small_width}:{small_height}:{(cover_width - small_width) // 2}:{(cover_height - small_height) // 2},"
+            f"gblur=sigma={sigma:.2f},scale={target_width}:{target_height}:flags=bilinear"
+        )
+        gradient = self._gradient_scale((target_width, target_height), gradient_blend) if gradient_blend > 0.0 else None
+        if gradient is None:
+            return (f"{background},{_DIM_BACKGROUND_FILTER}[{label}_bgd];"
+                    f"[{label}_bgd][{label}_fg]overlay={x}:{y}[{label}]"), None
+        
+        # Gradient and dim as one grayscale multiplier, blended in RGB like the MoviePy path
+        mask_path = os.path.join(mask_dir, f"{label}_gradient.png")
+        cv2.imwrite(mask_path, np.rint(gradient * 0.8 * 255).clip(0, 255).astype(np.uint8))
+        return (
+            f"{background},format=gbrp[{label}_bgs];[{mask_input}:v]format=gbrp[{label}_mask];"
+            f"[{label}_bgs][{label}_mask]blend=all_mode=multiply:shortest=1[{label}_bgd];"
+            f"[{label}_bgd][{label}_fg]overlay={x}:{y}[{label}]"
+        ), mask_path
 
-    def _apply_gradient_blend(self, clip, gradient_strength: float):
+    def _gradient_scale(self, size: Tuple[int, int], gradient_strength: float) -> Optional[np.ndarray]:
         """
-        Apply a gradient blend effect to create a bleeding/vignette effect.
+        Per-pixel brightness multiplier for a gradient blend (bleeding/vignette) effect.
         Optimized for performance with automatic quality scaling based on resolution.
         
         Args:
-            clip: Video clip to apply gradient to
+            size: Frame size (width, height)
             gradient_strength: Strength of gradient effect (0.0-1.0)
             
         Returns:
-            Video clip with gradient blend applied
+            float32 (height, width) multiplier in [0, 1], or None when no gradient should be applied
         """
         try:
-            width, height = clip.size
+            width, height = size
             total_pixels = width * height
             
             # Performance optimization: Skip gradient for very high resolutions or very low strength
             if gradient_strength < 0.05:
-                print(f"⏭️ Skipping gradient blend (strength too low: {gradient_strength})")
-                return clip
+                logger.debug("Skipping gradient blend (strength too low: %s)", gradient_strength)
+                return None
                 
             # Automatic quality scaling based on resolution
             if total_pixels > 2073600:  # > 1920x1080
-                print(f"🚀 High resolution detected ({width}x{height}) - using fast gradient mode")
-                return self._apply_fast_gradient_blend(clip, gradient_strength)
+                logger.debug("High resolution detected (%sx%s) - using fast gradient mode", width, height)
+                return self._fast_gradient_scale(width, height, gradient_strength)
             else:
-                print(f"🎨 Standard resolution ({width}x{height}) - using full quality gradient")
-                return self._apply_standard_gradient_blend(clip, gradient_strength)
+                logger.debug("Standard resolution (%sx%s) - using full quality gradient", width, height)
+                return self._standard_gradient_scale(width, height, gradient_strength)
             
-        except Exception as e:
-            print(f"⚠️ Error applying gradient blend: {str(e)}")
-            # Return original clip if gradient fails
-            return clip
+        except (MemoryError, ValueError) as e:
+            # Only allocation/shape failures fall back; anything else is a bug and should surface
+            logger.error("Error applying gradient blend: %s", e)
+            logger.warning("Gradient blend disabled for %dx%d: %s", size[0], size[1], e)
+            return None
 
-    def _apply_fast_gradient_blend(self, clip, gradient_strength: float):
+    @staticmethod
+    def _normalized_distance_sq(width: int, height: int) -> np.ndarray:
         """
-        Fast gradient blend for high-resolution videos using downscaling technique.
+        float32 (height, width) squared distance from the frame center, divided by the squared
+        center-to-corner distance (so 0 at the center, about 1 in the corners).
         """
-        try:
-            width, height = clip.size
-            
-            # Use a simplified radial gradient that's much faster
-            import numpy as np
-            
-            # Create a smaller gradient mask for performance (max 720p equivalent)
-            mask_width = min(width, 1280)
-            mask_height = min(height, 720)
-            
-            # Calculate center coordinates for the mask
-            center_x, center_y = mask_width // 2, mask_height // 2
-            max_distance = np.sqrt((mask_width/2)**2 + (mask_height/2)**2)
-            
-            # Create coordinate grids for the mask
-            y, x = np.ogrid[:mask_height, :mask_width]
-            distance_from_center = np.sqrt((x - center_x)**2 + (y - center_y)**2)
-            normalized_distance = distance_from_center / max_distance
-            
-            # Create a simple radial gradient (faster than sigmoid)
-            gradient_mask = np.clip(gradient_strength * normalized_distance, 0.0, gradient_strength)
-            
-            # If mask size is different from video size, we'll scale it during application
-            def apply_fast_gradient_to_frame(frame):
-                """Apply fast gradient mask to a single frame"""
-                frame_float = frame.astype(np.float32)
-                
-                # If mask size doesn't match frame size, resize the mask
-                if gradient_mask.shape != (frame.shape[0], frame.shape[1]):
-                    try:
-                        from scipy.ndimage import zoom
-                        scale_y = frame.shape[0] / gradient_mask.shape[0]
-                        scale_x = frame.shape[1] / gradient_mask.shape[1]
-                        resized_mask = zoom(gradient_mask, (scale_y, scale_x), order=1)  # Linear interpolation
-                    except ImportError:
-                        # Fallback: use simple numpy resize (less precise but faster)
-                        print(f"⚠️ SciPy not available, using numpy resize fallback")
-                        from numpy import interp
-                        # Simple linear interpolation fallback
-                        h_ratio = frame.shape[0] / gradient_mask.shape[0]
-                        w_ratio = frame.shape[1] / gradient_mask.shape[1]
-                        if h_ratio != 1.0 or w_ratio != 1.0:
-                            # For performance, just use the smaller mask and tile it
-                            resized_mask = np.tile(gradient_mask, (int(h_ratio) + 1, int(w_ratio) + 1))[:frame.shape[0], :frame.shape[1]]
-                        else:
-                            resized_mask = gradient_mask
-                else:
-                    resized_mask = gradient_mask
-                
-                # Convert to 3-channel mask
-                gradient_mask_3d = np.stack([resized_mask] * 3, axis=-1)
-                
-                # Apply gradient: simple multiplication (faster than complex blending)
-                modified_frame = frame_float * (1.0 - gradient_mask_3d * 0.5)  # Less aggressive for speed
-                
-                return np.clip(modified_frame, 0, 255).astype(np.uint8)
-            
-            print(f"🚀 Fast gradient applied: {mask_width}x{mask_height} mask → {width}x{height} video")
-            return clip.fl_image(apply_fast_gradient_to_frame)
-            
-        except Exception as e:
-            print(f"⚠️ Fast gradient failed, using no gradient: {str(e)}")
-            return clip
+        center_x, center_y = width // 2, height // 2
+        max_distance_sq = (width * width + height * height) / 4.0
+        y, x = np.ogrid[:height, :width]
+        dx_sq = ((x - center_x).astype(np.float32) ** 2) / np.float32(max_distance_sq)
+        dy_sq = ((y - center_y).astype(np.float32) ** 2) / np.float32(max_distance_sq)
+        return dx_sq + dy_sq
 
-    def _apply_standard_gradient_blend(self, clip, gradient_strength: float):
+    @staticmethod
+    def _fast_gradient_scale(width: int, height: int, gradient_strength: float) -> np.ndarray:
         """
-        Standard quality gradient blend for normal resolution videos.
+        Fast gradient for high-resolution videos, built on a downscaled mask.
         """
-        try:
-            width, height = clip.size
-            
-            # Create a gradient mask using numpy
-            import numpy as np
-            
-            # Pre-compute the gradient mask once (major performance improvement)
-            y, x = np.ogrid[:height, :width]
-            center_x, center_y = width // 2, height // 2
-            max_distance = np.sqrt((width/2)**2 + (height/2)**2)
-            distance_from_center = np.sqrt((x - center_x)**2 + (y - center_y)**2)
-            normalized_distance = distance_from_center / max_distance
-            
-            # Use a simpler gradient function (faster than sigmoid)
-            gradient_mask = np.clip(gradient_strength * normalized_distance**1.5, 0.0, gradient_strength)
-            gradient_mask_3d = np.stack([gradient_mask] * 3, axis=-1)
-            
-            def apply_standard_gradient_to_frame(frame):
-                """Apply standard gradient mask to a single frame"""
-                frame_float = frame.astype(np.float32)
-                
-                # Apply gradient with optimized calculation
-                modified_frame = frame_float * (1.0 - gradient_mask_3d * 0.7)
-                
-                return np.clip(modified_frame, 0, 255).astype(np.uint8)
-            
-            print(f"🎨 Standard gradient applied: {width}x{height} (strength: {gradient_strength})")
-            return clip.fl_image(apply_standard_gradient_to_frame)
-            
-        except Exception as e:
-            print(f"⚠️ Standard gradient failed, using no gradient: {str(e)}")
-            return clip
+        # Use a simplified radial gradient that's much faster
+        # Create a smaller gradient mask for performance (max 720p equivalent)
+        mask_width = min(width, 1280)
+        mask_height = min(height, 720)
+        
+        # Normalized squared distance from the center; everything below stays float32
+        normalized_distance_sq = VideoProcessor._normalized_distance_sq(mask_width, mask_height)
+        strength = np.float32(gradient_strength)
+        
+        # Create a simple radial gradient (faster than sigmoid)
+        gradient_mask = np.clip(strength * np.sqrt(normalized_distance_sq), np.float32(0.0), strength)
+        
+        # Bring the mask to the video size once (bilinear) instead of resizing it on every frame
+        if gradient_mask.shape != (height, width):
+            gradient_mask = cv2.resize(gradient_mask, (width, height), interpolation=cv2.INTER_LINEAR)
+        
+        logger.debug("Fast gradient applied: %sx%s mask → %sx%s video", mask_width, mask_height, width, height)
+        return np.float32(1.0) - gradient_mask * np.float32(0.5)  # Less aggressive for speed
+
+    @staticmethod
+    def _standard_gradient_scale(width: int, height: int, gradient_strength: float) -> np.ndarray:
+        """
+        Standard quality gradient for normal resolution videos.
+        """
+        # Pre-compute the gradient mask once (major performance improvement)
+        normalized_distance_sq = VideoProcessor._normalized_distance_sq(width, height)
+        
+        # Use a simpler gradient function (faster than sigmoid); distance**1.5 as d * sqrt(d),
+        # two vectorized square roots instead of a libm pow per pixel
+        strength = np.float32(gradient_strength)
+        normalized_distance = np.sqrt(normalized_distance_sq)
+        gradient_mask = np.clip(strength * normalized_distance * np.sqrt(normalized_distance),
+                                np.float32(0.0), strength)
+        
+        logger.debug("Standard gradient applied: %sx%s (strength: %s)", width, height, gradient_strength)
+        return np.float32(1.0) - gradient_mask * np.float32(0.7)
 
-    def _concatenate_videos_ffmpeg_lossless(self, video_paths: List[str], output_path: str) -> bool:
+    @staticmethod
+    def _fixed_point_scale(multiplier) -> np.ndarray:
         """
-        Concatenate videos using FFmpeg direct command with concat demuxer for lossless stream copying.
-        Assumes input videos are in a compatible format (e.g., intermediate lossless MKV).
+        Brightness multiplier (scalar or per-pixel) in Q15 fixed point; a per-pixel multiplier
+        gets a trailing axis of length 1 so it broadcasts over the channels without copies.
+        
+        Frames are scaled with `(frame * scale) >> 15` (see frame_kernels.scale_frame), which never
+        leaves integer arithmetic; a multiplier of at most 1 needs no clipping afterwards.
+        """
+        scale = np.rint(np.asarray(multiplier) * SCALE_ONE).clip(0, SCALE_ONE).astype(np.uint16)
+        if scale.ndim < 2:
+            return scale
+        return scale[:, :, np.newaxis]
+
+    def _concat_demux(self, video_paths: List[str], output_path: str,
+                      codec_args: Optional[List[str]] = None,
+                      trims: Optional[List[Optional[Tuple[float, float]]]] = None) -> bool:
+        """
+        Concatenate videos using FFmpeg direct command with concat demuxer.
+        Stream copies by default, which assumes input videos are in a compatible format
+        (e.g., intermediate lossless MKV).
 
         Args:
             video_paths: List of paths to video files to concatenate.
             output_path: Path for the output concatenated video file.
+            codec_args: ffmpeg encoding arguments to re-encode with instead of stream copying.
+            trims: Optional (start, end) in seconds per video (None to use it whole), applied by
+                   the demuxer through inpoint/outpoint so no separate trim pass is needed.
 
         Returns:
             bool: True if successful, False otherwise.
         """
-        logging.info(f"Attempting FFmpeg direct lossless concatenation for {len(video_paths)} videos to {output_path}")
+        logger.info("Attempting FFmpeg direct concatenation for %d videos to %s", len(video_paths), output_path)
         if len(video_paths) < 1:
-            logging.error("No videos provided for FFmpeg concatenation.")
+            logger.error("No videos provided for FFmpeg concatenation.")
             return False
 
         # Ensure output directory exists
@@ -1430,53 +2877,56 @@ class VideoProcessor:
         list_file_path = ""
         try:
             with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as tmp_list_file:
-                for path in video_paths:
+                for index, path in enumerate(video_paths):
                     # FFmpeg concat demuxer requires 'file' directive and quoted paths
                     # Paths need to be absolute or relative to where ffmpeg is run (safer with absolute)
-                    abs_path = os.path.abspath(path)
+                    abs_path = os.path.abspath(path).replace("'", "'\\''")
                     tmp_list_file.write(f"file '{abs_path}'\n")
+                    trim = trims[index] if trims else None
+                    if trim is not None:
+                        tmp_list_file.write(f"inpoint {trim[0]:.6f}\noutpoint {trim[1]:.6f}\n")
                 list_file_path = tmp_list_file.name
-            logging.debug(f"FFmpeg concat list file created: {list_file_path}")
+            logger.debug("FFmpeg concat list file created: %s", list_file_path)
 
             # Construct FFmpeg command
             # -f concat: Use the concat demuxer
             # -safe 0: Allow unsafe file paths (needed if paths are complex, though we use abs paths)
             # -i list_file_path: Input file list
-            # -c copy: Stream copy video and audio codecs (lossless and fast)
+            # -c copy: Stream copy video and audio codecs (lossless and fast), unless codec_args are given
             command = [
                 'ffmpeg',
                 '-y',  # Overwrite output file if it exists
                 '-f', 'concat',
                 '-safe', '0', 
                 '-i', list_file_path,
-                '-c', 'copy',
+                *(codec_args or ['-c', 'copy']),
                 output_path
             ]
             
-            logging.info(f"Executing FFmpeg command: {' '.join(command)}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Executing FFmpeg command: %s", ' '.join(command))
             process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
             stdout, stderr = process.communicate()
 
             if process.returncode == 0:
-                logging.info(f"FFmpeg direct concatenation successful: {output_path}")
+                logger.info("FFmpeg direct concatenation successful: %s", output_path)
                 return True
             else:
-                logging.error(f"FFmpeg direct concatenation failed. Return code: {process.returncode}")
-                logging.error(f"FFmpeg stdout: {stdout.decode(errors='ignore')}")
-                logging.error(f"FFmpeg stderr: {stderr.decode(errors='ignore')}")
+                logger.error("FFmpeg direct concatenation failed. Return code: %s", process.returncode)
+                logger.error("FFmpeg stdout: %s", stdout.decode(errors='ignore'))
+                logger.error("FFmpeg stderr: %s", stderr.decode(errors='ignore'))
                 return False
 
         except Exception as e:
-            logging.error(f"Exception during FFmpeg direct concatenation: {str(e)}")
-            traceback.print_exc()
+            logger.exception("Exception during FFmpeg direct concatenation: %s", e)
             return False
         finally:
             if list_file_path and os.path.exists(list_file_path):
                 try:
                     os.remove(list_file_path)
-                    logging.debug(f"Removed temp list file: {list_file_path}")
+                    logger.debug("Removed temp list file: %s", list_file_path)
                 except Exception as e_remove:
-                    logging.warning(f"Failed to remove temp list file {list_file_path}: {e_remove}")
+                    logger.warning("Failed to remove temp list file %s: %s", list_file_path, e_remove)
 
 
 # Example usage
@@ -1485,52 +2935,40 @@ if __name__ == "__main__":
     
     # Example: Convert 16:9 video to 9:16 (portrait)
     input_file = "input_video.mp4"
-    output_file = "output_video_9_16.mp4"
-    
-    # Method 1: Crop to fit (may lose content from sides/top/bottom)
-    success = processor.resize_aspect_ratio(
-        input_path=input_file,
-        output_path=output_file,
-        target_ratio=(9, 16),
-        resize_method='crop'
-    )
-    
-    # Method 2: Add padding (letterbox/pillarbox)
-    output_file_padded = "output_video_9_16_padded.mp4"
-    success = processor.resize_aspect_ratio(
-        input_path=input_file,
-        output_path=output_file_padded,
-        target_ratio=(9, 16),
-        resize_method='pad',
-        pad_color=(255, 255, 255),  # White padding
-        blur_background=False
-    )
-    
-    # Method 3: Add padding with blurred background (cinematic effect)
-    output_file_blurred = "output_video_9_16_blurred.mp4"
-    success = processor.resize_aspect_ratio(
-        input_path=input_file,
-        output_path=output_file_blurred,
-        target_ratio=(9, 16),
-        resize_method='pad',
-        blur_background=True,  # Use blurred background instead of solid color
-        blur_strength=30,      # Strong blur effect (1-50)
-        gradient_blend=0.4     # Moderate gradient bleeding effect (0.0-1.0)
-    )
     
-    # Method 4: Add padding with custom blur and gradient settings
-    output_file_custom = "output_video_9_16_custom.mp4"
-    success = processor.resize_aspect_ratio(
-        input_path=input_file,
-        output_path=output_file_custom,
-        target_ratio=(9, 16),
-        resize_method='pad',
-        blur_background=True,
-        blur_strength=15,      # Lighter blur effect
-        gradient_blend=0.6     # Strong gradient bleeding effect for artistic look
-    )
+    # All four variants are written from a single decode of the input
+    success = processor.resize_aspect_ratio_many(input_file, {
+        # Method 1: Crop to fit (may lose content from sides/top/bottom)
+        "output_video_9_16.mp4": dict(
+            target_ratio=(9, 16),
+            resize_method='crop'
+        ),
+        # Method 2: Add padding (letterbox/pillarbox)
+        "output_video_9_16_padded.mp4": dict(
+            target_ratio=(9, 16),
+            resize_method='pad',
+            pad_color=(255, 255, 255),  # White padding
+            blur_background=False
+        ),
+        # Method 3: Add padding with blurred background (cinematic effect)
+        "output_video_9_16_blurred.mp4": dict(
+            target_ratio=(9, 16),
+            resize_method='pad',
+            blur_background=True,  # Use blurred background instead of solid color
+            blur_strength=30,      # Strong blur effect (1-50)
+            gradient_blend=0.4     # Moderate gradient bleeding effect (0.0-1.0)
+        ),
+        # Method 4: Add padding with custom blur and gradient settings
+        "output_video_9_16_custom.mp4": dict(
+            target_ratio=(9, 16),
+            resize_method='pad',
+            blur_background=True,
+            blur_strength=15,      # Lighter blur effect
+            gradient_blend=0.6     # Strong gradient bleeding effect for artistic look
+        ),
+    })
     
     # Get video information
     info = processor.get_video_info(input_file)
     if info:
-        print(f"Video info: {info}")
\ No newline at end of file
+        print(f"Video info: {info}")